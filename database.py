@@ -1,8 +1,6 @@
 import os
-import json
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-from supabase import create_client, Client
 from dotenv import load_dotenv
 
 # 환경변수 로드
@@ -17,6 +15,7 @@ class GameDatabase:
         if not self.url or not self.key:
             raise ValueError("APP_SUPABASE_URL과 APP_SUPABASE_ANON_KEY 환경변수가 필요합니다.")
         
+        from supabase import create_client, Client  # 시작 속도를 위해 사용 시점에 import
         self.supabase: Client = create_client(self.url, self.key)
     
     def get_games_by_month_range(self, current_date: datetime = None) -> List[Dict]:
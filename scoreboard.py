@@ -3,17 +3,26 @@ import tkinter as tk
 from tkinter import font, messagebox, ttk
 import json
 import os
+import sys
 import time
 import threading
+import queue
+import hashlib
+from functools import lru_cache, partial
+from pathlib import Path
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import argparse
+import atexit
+import traceback
 from dotenv import load_dotenv
-from supabase import create_client, Client
 from database import get_database
-import pygame  # 사운드 재생용
-from PIL import Image, ImageTk  # 이미지 처리용
-import requests  # 이미지 다운로드용
+# supabase, pygame, PIL, requests는 시작 속도를 위해 실제로 쓰는 함수 안에서 import
 from io import BytesIO  # 이미지 메모리 처리용
+try:
+    import orjson  # 설정 파일 직렬화 가속 (선택적 의존성)
+except ImportError:
+    orjson = None
 
 # ===== 기본 설정 =====
 PERIOD_MAX_DEFAULT = 4
@@ -21,58 +30,103 @@ GAME_SECONDS_DEFAULT = 10*60
 SHOT_SECONDS_DEFAULT = 24
 
 CONFIG_PATH = os.path.expanduser("~/.scoreboard_config.json")
+LOGO_CACHE_DIR = Path.home() / ".scoreboard_cache" / "logos"
+
+# 조작용 창 키보드 단축키 안내 (고정 텍스트)
+HINTS_TEXT = (
+    "점수: 1/2/3(A팀 +1/+2/+3) | 0/9/8(B팀 +1/+2/+3) | `/-(A/B팀 -1)\n"
+    "게임시간: 스페이스(play/pause) | t(시간 리셋) | ←→(±1초) | ↑↓(±10초) | <>(±1분)\n"
+    "샷클럭: s(play/pause) | a/z(±1초) | d(24초 리셋) | f(14초 리셋)\n"
+    "홈팀(A): q/Q(타임아웃 -/+) | w/W(파울 +/-) | 원정팀(B): p/P(타임아웃 -/+) | o/O(파울 +/-)\n"
+    "게임: R(전체 리셋) | [](쿼터 ±1) | F2(설정) | F3(게임 변경) | F4(모니터 전환) | Esc(종료 확인)"
+)
+SIMPLE_HINTS_TEXT = "Space(시작) | t(시간리셋) | s(샷클럭) | d/f(24/14초) | F2(설정)"
 
 # Supabase 설정
 load_dotenv()
 SUPABASE_URL = os.getenv("APP_SUPABASE_URL")
 SUPABASE_KEY = os.getenv("APP_SUPABASE_ANON_KEY")
 WEB_VIEWER_URL = os.getenv("APP_WEB_VIEWER_URL", "")  # 웹 뷰어 URL (방송 채널 표시용)
+try:
+    SUPABASE_TIMEOUT = float(os.getenv("APP_SUPABASE_TIMEOUT", "10"))  # PostgREST 요청 타임아웃 (초)
+except ValueError:
+    print(f"경고: APP_SUPABASE_TIMEOUT 값이 잘못되었습니다 ({os.getenv('APP_SUPABASE_TIMEOUT')!r}), 10초 사용")
+    SUPABASE_TIMEOUT = 10.0
+
+# 간단한 디버그 로깅 (상세 상태 출력은 APP_DEBUG=1일 때만)
+DEBUG = os.getenv("APP_DEBUG", "0").lower() in {"1", "true", "yes", "on"}
+def dlog(message: str, *args):
+    """APP_DEBUG일 때만 출력 (args가 있으면 % 포맷을 출력할 때만 수행)"""
+    if DEBUG:
+        print(f"[scoreboard] {message % args if args else message}")
+
+@lru_cache(maxsize=1)
+def get_http_session():
+    """로고 다운로드용 HTTP 세션 (연결 재사용으로 매번 TLS 핸드셰이크 하지 않음)"""
+    import requests  # 이미지 다운로드용
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=1))
+    atexit.register(session.close)
+    return session
 
-def init_supabase_client():
-    """Supabase 클라이언트 초기화"""
+_supabase_client = None  # 생성에 성공한 클라이언트만 보관 (실패는 다음 호출 때 다시 시도)
+
+def get_supabase_client():
+    """Supabase 클라이언트 (프로세스 전체에서 하나를 공유, 게임 변경 시 재생성하지 않음)"""
+    global _supabase_client
+    if _supabase_client is not None:
+        return _supabase_client
     if not SUPABASE_URL or not SUPABASE_KEY:
         print("경고: Supabase 설정이 없습니다. .env 파일을 확인하세요.")
         return None
     
     try:
-        supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+        from supabase import create_client, Client, ClientOptions
+        # 요청이 멈춰도 전송 워커가 오래 묶이지 않도록 타임아웃 지정 (기본값은 120초)
+        options = ClientOptions(postgrest_client_timeout=SUPABASE_TIMEOUT)
+        supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY, options=options)
+        _supabase_client = supabase
         return supabase
     except Exception as e:
         print(f"Supabase 클라이언트 초기화 실패: {e}, {SUPABASE_URL}, {SUPABASE_KEY}")
         return None
 
+def close_supabase_client():
+    """공유 Supabase 클라이언트의 HTTP 연결 정리 (앱 종료 시 호출)"""
+    global _supabase_client
+    client, _supabase_client = _supabase_client, None
+    if client is None:
+        return
+    try:
+        session = getattr(client.postgrest, "session", None)
+        if session is not None:
+            session.close()
+    except Exception as e:
+        print(f"Supabase 클라이언트 정리 실패: {e}")
+
 # generate_game_id 함수는 더 이상 사용하지 않음 (고정된 "pyscore" 사용)
 
-def update_live_score_to_supabase(supabase_client, game_id, score_data):
-    """Supabase에 라이브 스코어 업데이트"""
+def update_live_score_to_supabase(supabase_client, game_id, score_data, full=True):
+    """Supabase에 라이브 스코어 업데이트 (full이면 전체 행 upsert, 아니면 바뀐 컬럼만 update)"""
     if not supabase_client:
         return False
     
     try:
-        # upsert 사용하여 게임 데이터 업데이트/삽입
-        update_data = {
-            'game_id': game_id,
-            'team1_name': score_data['team1_name'],
-            'team2_name': score_data['team2_name'],
-            'team1_score': score_data['team1_score'],
-            'team2_score': score_data['team2_score'],
-            'team1_fouls': score_data['team1_fouls'],
-            'team2_fouls': score_data['team2_fouls'],
-            'team1_timeouts': score_data['team1_timeouts'],
-            'team2_timeouts': score_data['team2_timeouts'],
-            'current_quarter': score_data['current_quarter'],
-            'quarter_time': score_data['quarter_time'],
-            'game_status': score_data['game_status'],
-            'shot_clock': int(score_data['shot_clock']),  # 24초 필드 추가
-            'team1_color': score_data['team1_color'],  # 팀 컬러 전송 (live_score 테이블용)
-            'team2_color': score_data['team2_color'],  # 팀 컬러 전송 (live_score 테이블용)
-            # 로고 정보 항상 추가 (None이어도 전송하여 이전 값 제거)
-            'team1_logo': score_data.get('team1_logo'),
-            'team2_logo': score_data.get('team2_logo'),
-            'last_updated': datetime.now().isoformat()
-        }
-        
-        result = supabase_client.table('live_scores').upsert(update_data, on_conflict='game_id').execute()
+        update_data = dict(score_data)
+        if 'shot_clock' in update_data:
+            update_data['shot_clock'] = int(update_data['shot_clock'])  # 24초 필드
+        update_data['last_updated'] = datetime.now().isoformat()
+        
+        table = supabase_client.table('live_scores')
+        if full:
+            # 세션 첫 전송: upsert 사용하여 게임 데이터 업데이트/삽입
+            update_data['game_id'] = game_id
+            table.upsert(update_data, on_conflict='game_id').execute()
+        else:
+            # 이후에는 바뀐 컬럼만 PATCH
+            update_data.pop('game_id', None)
+            table.update(update_data).eq('game_id', game_id).execute()
         
         return True
     except Exception as e:
@@ -82,15 +136,23 @@ def update_live_score_to_supabase(supabase_client, game_id, score_data):
 def load_cfg():
     if os.path.exists(CONFIG_PATH):
         try:
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                cfg = json.load(f)
-                
-                # 구버전 호환성: team_swapped를 두 개로 분리
-                if "team_swapped" in cfg and "control_team_swapped" not in cfg:
-                    cfg["control_team_swapped"] = cfg["team_swapped"]
-                    cfg["presentation_team_swapped"] = cfg["team_swapped"]
-                
-                return cfg
+            if orjson:
+                with open(CONFIG_PATH, "rb") as f:
+                    cfg = orjson.loads(f.read())
+            else:
+                with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+                    cfg = json.load(f)
+            
+            # 파일에 있는 내용 기록 (마이그레이션 없이 그대로 다시 저장하게 되면 쓰기 생략)
+            global _last_written_cfg
+            _last_written_cfg = _dump_cfg(cfg)
+            
+            # 구버전 호환성: team_swapped를 두 개로 분리
+            if "team_swapped" in cfg and "control_team_swapped" not in cfg:
+                cfg["control_team_swapped"] = cfg["team_swapped"]
+                cfg["presentation_team_swapped"] = cfg["team_swapped"]
+            
+            return cfg
         except Exception:
             pass
     return {
@@ -114,34 +176,171 @@ def load_cfg():
         "game_id": "novato-scoreboard",  # 게임 ID
     }
 
+_cfg_write_lock = threading.Lock()  # 쓰기 워커가 둘 이상일 때(게임 변경 직후 이전 워커 등) 같은 임시 파일을 동시에 쓰지 않도록
+_last_written_cfg = None  # 마지막으로 읽거나 쓴 설정 파일 내용 (같으면 쓰기 생략)
+
+def _dump_cfg(cfg):
+    """설정 -> 파일에 쓸 바이트"""
+    if orjson:
+        return orjson.dumps(cfg, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(cfg, ensure_ascii=False, indent=2).encode("utf-8")
+
 def save_cfg(cfg):
-    try:
-        config_dir = os.path.dirname(CONFIG_PATH)
-        if not os.path.exists(config_dir):
-            os.makedirs(config_dir, exist_ok=True)
-        
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, ensure_ascii=False, indent=2)
-    except Exception:
-        pass
+    global _last_written_cfg
+    with _cfg_write_lock:
+        try:
+            data = _dump_cfg(cfg)
+            if data == _last_written_cfg:
+                return
+            config_dir = os.path.dirname(CONFIG_PATH)
+            if not os.path.exists(config_dir):
+                os.makedirs(config_dir, exist_ok=True)
+            
+            # 임시 파일에 쓴 뒤 교체 (저장 중 종료되어도 설정 파일이 깨지지 않음)
+            tmp_path = CONFIG_PATH + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, CONFIG_PATH)
+            _last_written_cfg = data
+        except Exception:
+            pass
 
-def fmt_mmss(s):
-    s = max(0, int(s))
-    m = s // 60
-    r = s % 60
+@lru_cache(maxsize=4096)
+def _fmt_mmss_cached(s):
+    """정수 초 -> "MM:SS" (같은 초는 캐시된 문자열 재사용)"""
+    m, r = divmod(s, 60)
     return f"{m:02d}:{r:02d}"
 
+def fmt_mmss(s):
+    return _fmt_mmss_cached(max(0, int(s)))
+
+@lru_cache(maxsize=4096)
+def _fmt_fifth_cached(n):
+    """1/5초 단위 정수 -> "MM:SS.f" (10분 쿼터 3000개 값이 모두 캐시에 들어감)"""
+    m, r = divmod(n, 300)
+    s, f = divmod(r, 5)
+    return f"{m:02d}:{s:02d}.{f * 2}"
+
+def _NOOP():
+    """표에 없는 키 등 할 일이 없을 때 호출하는 빈 함수"""
+
+_STR_INT = tuple(str(i) for i in range(200))  # 점수/파울/샷 클럭 등 작은 정수 문자열
+
+def _int_str(n):
+    """작은 정수는 미리 만든 문자열 재사용"""
+    return _STR_INT[n] if 0 <= n < 200 else str(n)
+
 def fmt_mmss_centi(s):
     """1/5초까지 표시하는 시간 포맷 (0.0, 0.2, 0.4, 0.6, 0.8)"""
-    s = max(0, s)
-    m = int(s) // 60
-    r = int(s) % 60
-    # 1/5초 단위로 변환 (5분의 1 = 0.2초)
-    fifth = int((s - int(s)) * 5) * 2  # 0, 2, 4, 6, 8
-    return f"{m:02d}:{r:02d}.{fifth:01d}"
+    return _fmt_fifth_cached(int(max(0, s) * 5))
+
+# 색상 이름 -> hex (하위 호환성)
+_DEFAULT_COLOR = "#F4F4F4"  # 기본값: 흰색
+_COLOR_MAP = {
+    "white": "#F4F4F4",
+    "red": "#EF4444",
+    "blue": "#2563EB",
+    "yellow": "#FACC15",
+    "green": "#22C55E",
+    "lightgreen": "#22C55E",
+    "black": "#222222",
+}
+
+# 설정 창 팀 컬러 팔레트 (hex, 표시 이름)
+_TEAM_COLORS = (("#F4F4F4", "흰색"), ("#2563EB", "파랑"), ("#EF4444", "빨강"),
+                ("#FACC15", "노랑"), ("#222222", "검정"), ("#22C55E", "녹색"))
+_COLOR_NAME_BY_HEX = dict(_TEAM_COLORS)
+
+@lru_cache(maxsize=64)
+def color_to_hex(color_value):
+    """색상 값(hex 코드 또는 색상 이름)을 hex 코드로 변환"""
+    if not color_value:
+        return _DEFAULT_COLOR
+    # 이미 hex 코드인 경우 (#로 시작)
+    if isinstance(color_value, str) and color_value[:1] == '#':
+        return color_value
+    return _COLOR_MAP.get(color_value, _DEFAULT_COLOR)
+
+def _thumb(im, size):
+    """정수 배율로 먼저 축소(reduce)한 뒤 마지막 2배 이내 구간만 LANCZOS로 리사이즈"""
+    from PIL import Image
+    im.draft('RGB', (size[0] * 2, size[1] * 2))  # JPEG는 디코딩 단계에서 축소 (그 외 포맷은 무시됨)
+    f = max(1, min(im.size[0] // (size[0] * 2), im.size[1] // (size[1] * 2)))
+    if f > 1:
+        if im.mode not in ('L', 'LA', 'RGB', 'RGBA'):
+            im = im.convert('RGBA')  # 팔레트(P) 이미지는 reduce 미지원
+        im = im.reduce(f)
+    im.thumbnail(size, Image.Resampling.LANCZOS)
+    return im
+
+@lru_cache(maxsize=32)
+def fetch_logo_thumbnail(url, size=(150, 150)):
+    """로고 썸네일(PIL Image) 반환 - 디스크 캐시 우선, 없으면 다운로드 후 저장 (백그라운드 스레드에서 호출 가능)"""
+    from PIL import Image  # 이미지 처리용
+    key = hashlib.blake2b(f"{url}|{size[0]}x{size[1]}".encode()).hexdigest()[:16]
+    path = LOGO_CACHE_DIR / f"{key}.png"
+    if path.exists():
+        try:
+            img_data = Image.open(path)
+            img_data.load()
+            return img_data
+        except Exception as e:
+            print(f"로고 캐시 읽기 실패, 다시 다운로드: {path}, 오류: {e}")
+    
+    response = get_http_session().get(url, timeout=3)
+    response.raise_for_status()
+    img_data = _thumb(Image.open(BytesIO(response.content)), size)
+    try:
+        LOGO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        img_data.save(tmp_path, "PNG", optimize=True)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"로고 캐시 저장 실패: {path}, 오류: {e}")
+    return img_data
+
+class _NoopSound:
+    """사운드를 쓸 수 없을 때 쓰는 버저 (재생 요청을 무시, 매 재생마다 None 검사 생략)"""
+    def play(self):
+        pass
+
+class _Buzzer:
+    """버저 사운드를 전용 채널에서 재생"""
+    def __init__(self, sound, channel):
+        self.sound = sound
+        self.channel = channel
+    
+    def play(self):
+        # 재생 실패가 타이머 프레임을 멈추지 않도록 오류는 출력만
+        try:
+            self.channel.play(self.sound)
+        except Exception as e:
+            print(f"버저 재생 실패: {e}")
+
+@lru_cache(maxsize=1)
+def load_buzzer():
+    """버저 반환 (작은 버퍼로 믹서를 초기화해 재생 지연 최소화, 실패 시 _NoopSound)"""
+    try:
+        import pygame  # 사운드 재생용
+        if not pygame.mixer.get_init():
+            pygame.mixer.pre_init(44100, -16, 2, 256)
+            pygame.mixer.init()
+        pygame.mixer.set_reserved(1)  # 채널 0은 버저 전용
+        buzzer_path = os.path.join(os.path.dirname(__file__), "sound", "buzzer_main.wav")
+        sound = pygame.mixer.Sound(buzzer_path)
+        print(f"버저 사운드 로드 성공: {buzzer_path}")
+        return _Buzzer(sound, pygame.mixer.Channel(0))
+    except Exception as e:
+        print(f"사운드 초기화 실패: {e}")
+        return _NoopSound()
+
+# 로고 URL -> PhotoImage (다이얼로그를 다시 열 때 디코딩/변환 생략, 같은 Tk 인터프리터에서만 재사용)
+_photo_cache = {}
 
 def show_logo_selection_dialog(parent_window=None):
     """팀 로고 선택 다이얼로그"""
+    from PIL import ImageTk  # 이미지 처리용
+    
     # 기본 로고 URL 목록 (.env의 SUPABASE_URL 사용)
     if SUPABASE_URL:
         base_url = f"{SUPABASE_URL}/storage/v1/object/public/team-logo/default"
@@ -196,39 +395,64 @@ def show_logo_selection_dialog(parent_window=None):
         selected_logo['cancelled'] = True
         dialog.destroy()
     
+    # 로고 이미지는 동시에 다운로드하고, 도착하는 대로 자리표시 라벨에 표시
+    pool = ThreadPoolExecutor(max_workers=4)
+    pending_logos = []
+    
+    def apply_loaded_logos():
+        if not dialog.winfo_exists():
+            return
+        for item in list(pending_logos):
+            future, url, img_label = item
+            if not future.done():
+                continue
+            pending_logos.remove(item)
+            try:
+                # PhotoImage는 Tk 스레드에서만 생성
+                photo = ImageTk.PhotoImage(future.result())
+                _photo_cache[url] = photo
+                img_label.config(image=photo, text="")
+                img_label.image = photo  # 참조 유지
+            except Exception as e:
+                print(f"로고 로드 실패: {url}, 오류: {e}")
+                img_label.config(text="이미지 로드 실패", fg='red')
+        if pending_logos:
+            dialog.after(50, apply_loaded_logos)
+    
     # 로고 옵션 표시
     for option in logo_options:
         frame = tk.Frame(scrollable_frame, bg='#3a3a3a', relief=tk.RAISED, borderwidth=2)
         frame.pack(fill=tk.X, padx=10, pady=5)
         
-        # 이미지 로드 및 표시
+        # 이미지 로드 및 표시 (썸네일 크기 150x150)
         if option['url']:
-            try:
-                response = requests.get(option['url'], timeout=3)
-                img_data = Image.open(BytesIO(response.content))
-                # 썸네일 크기로 조정 (150x150)
-                img_data.thumbnail((150, 150), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img_data)
-                
+            photo = _photo_cache.get(option['url'])
+            if photo is not None and photo.tk is dialog.tk:
                 img_label = tk.Label(frame, image=photo, bg='#3a3a3a')
                 img_label.image = photo  # 참조 유지
                 img_label.pack(pady=10)
-            except Exception as e:
-                print(f"로고 로드 실패: {option['url']}, 오류: {e}")
-                tk.Label(frame, text="이미지 로드 실패", fg='red', bg='#3a3a3a').pack(pady=10)
+            else:
+                img_label = tk.Label(frame, text="불러오는 중...", fg='gray', bg='#3a3a3a')
+                img_label.pack(pady=10)
+                future = pool.submit(fetch_logo_thumbnail, option['url'])
+                pending_logos.append((future, option['url'], img_label))
         else:
             tk.Label(frame, text="(로고 없음)", fg='gray', bg='#3a3a3a', 
                     font=('Arial', 12)).pack(pady=30)
         
         # 선택 버튼
         tk.Button(frame, text=option['name'], 
-                 command=lambda url=option['url']: on_select(url),
+                 command=partial(on_select, option['url']),
                  font=('Arial', 11), bg='#4CAF50', fg='black', width=15).pack(pady=10)
     
     # 취소 버튼
     tk.Button(dialog, text="취소", command=on_cancel,
              font=('Arial', 11), bg='#f44336', fg='black', width=15).pack(pady=10)
     
+    pool.shutdown(wait=False)
+    if pending_logos:
+        dialog.after(50, apply_loaded_logos)
+    
     # Toplevel 윈도우는 wait_window() 사용 (mainloop() 대신)
     if parent_window:
         dialog.wait_window()
@@ -243,14 +467,29 @@ def show_logo_selection_dialog(parent_window=None):
     result_url = selected_logo['url']
     return result_url if result_url else ""
 
-def show_game_selection_dialog(small_screen=False):
-    """게임 선택 다이얼로그 표시"""
+def load_game_list():
+    """DB 연결과 게임 목록 조회 (백그라운드 미리 불러오기용, (db, games) 반환)"""
     db = get_database()
     if not db:
-        return None
+        return None, None
+    return db, db.get_games_by_month_range()
+
+def show_game_selection_dialog(small_screen=False, games_future=None):
+    """게임 선택 다이얼로그 표시 (games_future: 미리 시작한 load_game_list 결과)"""
+    db, games = None, None
+    if games_future is not None:
+        try:
+            db, games = games_future.result(timeout=5)
+        except Exception as e:
+            print(f"게임 목록 미리 불러오기 실패, 다시 조회: {e}")
     
-    # 게임 목록 가져오기
-    games = db.get_games_by_month_range()
+    if games is None:
+        db = get_database()
+        if not db:
+            return None
+        
+        # 게임 목록 가져오기
+        games = db.get_games_by_month_range()
     display_items = db.make_display_items(games)
     
     # 현재 설정 로드 (모니터 위치 확인)
@@ -409,6 +648,135 @@ def show_game_selection_dialog(small_screen=False):
     return selected_game['game']
 
 class DualMonitorScoreboard:
+    # 프레젠테이션 창 색상
+    _BG = '#111111'
+    _TIME_NORM = 'yellow'
+    _TIME_WARN = 'red'
+    _SHOT_NORM = 'orange'
+    _SHOT_WARN = 'red'
+    _TIME_FG = (_TIME_NORM, _TIME_WARN)  # 경고 구간 여부(bool)로 바로 조회
+    _SHOT_FG = (_SHOT_NORM, _SHOT_WARN)
+    
+    _TICK_MS = 16  # 타이머 주기 (약 60 FPS, 1/5초 표시용)
+    _IDLE_TICK_MS = 250  # 두 시계가 모두 멈췄을 때 주기 (조작 변경사항 동기화용)
+    _MAX_REDRAW_HZ = 25  # 1/5초 라벨 최대 갱신 횟수 (초당, 설정 max_redraw_hz로 변경 가능)
+    _SYNC_MIN_INTERVAL = 0.25  # 조작 변경사항 Supabase 전송 최소 간격 (초, 연타는 한 번에 묶어 전송)
+    
+    # 조작 버튼 정의 표: (텍스트, 메서드 이름, 인자, 글자색)
+    _SCORE_BTNS = {
+        'A': (("+1 (1)", 'update_score', ('A', 1), None), ("+2 (2)", 'update_score', ('A', 2), None),
+              ("+3 (3)", 'update_score', ('A', 3), None), ("-1 (`)", 'update_score', ('A', -1), None)),
+        'B': (("+1 (0)", 'update_score', ('B', 1), None), ("+2 (9)", 'update_score', ('B', 2), None),
+              ("+3 (8)", 'update_score', ('B', 3), None), ("-1 (-)", 'update_score', ('B', -1), None)),
+    }
+    _TEAM_CONTROL_ROWS = {
+        'A': ((("타임아웃 +1 (Q)", 'update_timeout', ('A', 1), 'red'), ("파울 -1 (W)", 'update_foul', ('A', -1), 'red')),
+              (("타임아웃 -1 (q)", 'update_timeout', ('A', -1), 'blue'), ("파울 +1 (w)", 'update_foul', ('A', 1), 'blue'))),
+        'B': ((("타임아웃 +1 (P)", 'update_timeout', ('B', 1), 'red'), ("파울 -1 (O)", 'update_foul', ('B', -1), 'red')),
+              (("타임아웃 -1 (p)", 'update_timeout', ('B', -1), 'blue'), ("파울 +1 (o)", 'update_foul', ('B', 1), 'blue'))),
+    }
+    _GAME_TIME_ROWS = (
+        (("-1초 (←)", 'adjust_time', (-1,), None), ("-10초 (↓)", 'adjust_time', (-10,), None), ("-1분 (<)", 'adjust_time', (-60,), None)),
+        (("+1초 (→)", 'adjust_time', (1,), None), ("+10초 (↑)", 'adjust_time', (10,), None), ("+1분 (>)", 'adjust_time', (60,), None)),
+    )
+    _SHOT_CLOCK_ROWS = (
+        (("-1초 (z)", 'adjust_shot_time', (-1,), None), ("-5초", 'adjust_shot_time', (-5,), None), ("14초 (f)", 'reset_shot_clock_14', (), None)),
+        (("+1초 (a)", 'adjust_shot_time', (1,), None), ("+5초", 'adjust_shot_time', (5,), None), ("24초 (d)", 'reset_shot_clock', (), None)),
+    )
+    _OTHER_ROWS_SMALL = (
+        (("리셋(r)", 'reset_all', (), None), ("시간(t)", 'reset_game_time', (), 'blue'),
+         ("Q-([)", 'adjust_period', (-1,), None), ("Q+(])", 'adjust_period', (1,), None)),
+        (("설정(F2)", 'show_settings', (), None), ("게임(F3)", 'change_game', (), 'orange'),
+         ("모니터(F4)", 'toggle_monitor_swap', (), 'purple'), ("종료(Esc)", 'on_closing', (), 'red')),
+    )
+    _OTHER_BTNS = (
+        ("전체 리셋 (r)", 'reset_all', (), None), ("시간 리셋 (t)", 'reset_game_time', (), 'blue'),
+        ("쿼터 -1 ([)", 'adjust_period', (-1,), None), ("쿼터 +1 (])", 'adjust_period', (1,), None),
+        ("설정 (F2)", 'show_settings', (), None), ("게임 변경 (F3)", 'change_game', (), 'orange'),
+        ("모니터 전환 (F4)", 'toggle_monitor_swap', (), 'purple'), ("종료 (Esc)", 'on_closing', (), 'red'),
+    )
+    
+    # 키보드 단축키 (keysym -> (메서드 이름, 인자))
+    _KEY_ACTIONS = {
+        # 점수
+        '1': ('update_score', ('A', 1)), '2': ('update_score', ('A', 2)), '3': ('update_score', ('A', 3)),
+        '0': ('update_score', ('B', 1)), '9': ('update_score', ('B', 2)), '8': ('update_score', ('B', 3)),
+        'grave': ('update_score', ('A', -1)),  # ` 키
+        'minus': ('update_score', ('B', -1)),
+        # 게임 시간
+        'space': ('toggle_game_time', ()),
+        't': ('reset_game_time', ()),
+        'Left': ('adjust_time', (-1,)), 'Right': ('adjust_time', (1,)),
+        'Up': ('adjust_time', (10,)), 'Down': ('adjust_time', (-10,)),
+        'comma': ('adjust_time', (-60,)),  # < 키
+        'period': ('adjust_time', (60,)),  # > 키
+        # 샷클럭
+        's': ('toggle_shot_time', ()),  # 샷클럭 play/pause
+        'a': ('adjust_shot_time', (1,)), 'z': ('adjust_shot_time', (-1,)),
+        'd': ('reset_shot_clock', ()),  # 24초 리셋
+        'f': ('reset_shot_clock_14', ()),  # 14초 리셋
+        # 쿼터, 전체 리셋
+        'bracketleft': ('adjust_period', (-1,)),  # [ 키
+        'bracketright': ('adjust_period', (1,)),  # ] 키
+        'r': ('reset_all', ()),
+        # 타임아웃/파울 조작 (홈팀 A, 원정팀 B)
+        'q': ('update_timeout', ('A', -1)), 'Q': ('update_timeout', ('A', 1)),
+        'w': ('update_foul', ('A', 1)), 'W': ('update_foul', ('A', -1)),
+        'p': ('update_timeout', ('B', -1)), 'P': ('update_timeout', ('B', 1)),
+        'o': ('update_foul', ('B', 1)), 'O': ('update_foul', ('B', -1)),
+        # 창/게임
+        'F2': ('show_settings', ()), 'F3': ('change_game', ()),
+        'F4': ('toggle_monitor_swap', ()), 'Escape': ('on_closing', ()),
+    }
+    
+    # 설정 창 위젯 기본 옵션 (옵션 DB 패턴, 값) - 다른 색이 필요한 위젯만 fg를 직접 지정
+    _SETTINGS_OPTIONS = (
+        ("*settings*Frame.background", "#2a2a2a"),
+        ("*settings*Labelframe.background", "#2a2a2a"),
+        ("*settings*Labelframe.foreground", "white"),
+        ("*settings*Label.background", "#2a2a2a"),
+        ("*settings*Label.foreground", "white"),
+        ("*settings*Checkbutton.background", "#2a2a2a"),
+        ("*settings*Checkbutton.foreground", "white"),
+        ("*settings*Checkbutton.selectColor", "#444444"),
+        ("*settings*Radiobutton.background", "#2a2a2a"),
+        ("*settings*Radiobutton.foreground", "white"),
+        ("*settings*Radiobutton.selectColor", "#444444"),
+    )
+    
+    # 마우스 휠 이벤트 (Windows/macOS, Linux 스크롤 업/다운)
+    _WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+    _BUTTON_SCROLL = {4: -1, 5: 1}  # Linux 휠 버튼 번호 -> 스크롤 칸 수
+    
+    # 글자색 -> 조작 버튼 ttk 스타일 이름
+    _BUTTON_STYLES = {
+        None: "Scoreboard.TButton",
+        'red': "Red.Scoreboard.TButton",
+        'blue': "Blue.Scoreboard.TButton",
+        'orange': "Orange.Scoreboard.TButton",
+        'purple': "Purple.Scoreboard.TButton",
+    }
+    
+    # 쿼터 표시 문자열 (매 프레임 f-string 생성 방지)
+    _PERIOD_TEXT = {i: f"Q{i}" for i in range(1, 10)}
+    
+    # 시계는 정수 밀리초(game_ms, shot_ms)로 저장, 초 단위 속성은 호환용
+    @property
+    def game_seconds(self):
+        return self.game_ms / 1000
+    
+    @game_seconds.setter
+    def game_seconds(self, value):
+        self.game_ms = round(value * 1000)
+    
+    @property
+    def shot_seconds(self):
+        return self.shot_ms / 1000
+    
+    @shot_seconds.setter
+    def shot_seconds(self, value):
+        self.shot_ms = round(value * 1000)
+    
     def __init__(self, selected_game=None, small_screen=False):
         self.cfg = load_cfg()
         
@@ -416,8 +784,9 @@ class DualMonitorScoreboard:
         self.small_screen = small_screen
         
         # Supabase 클라이언트 초기화
-        self.supabase_client = init_supabase_client()
+        self.supabase_client = get_supabase_client()
         self.game_id = self.cfg.get("game_id", "novato-scoreboard")  # 설정에서 게임 ID 가져오기
+        self._broadcast_channel = None  # get_broadcast_channel 캐시 (게임 ID 변경 시 초기화)
         print(f"게임 방송 채널: {self.get_broadcast_channel()}")
         print(f"화면 모드: {'작은 화면 (726x416)' if small_screen else '일반 화면'}")
         
@@ -439,45 +808,82 @@ class DualMonitorScoreboard:
         self.game_status = "scheduled"
         
         # 타이머
-        self.last_update = time.time()
-        self.timer_running = True
-        
-        # Supabase 업데이트용 타이머
-        self.supabase_update_timer = time.time()
-        self.supabase_update_interval = 1.0  # 1초마다 업데이트
-        self.last_score_data = None  # 이전 데이터 저장용
+        self._last_tick_ns = time.monotonic_ns()  # 단조 시계 정수 ns (시스템 시간 변경에 영향 없음)
+        self._tick_after = None  # 예약된 다음 프레임 after ID
+        self._tick_idle = False  # 다음 프레임이 느린 주기로 예약되었는지
+        self._render_after = None  # 예약된 유휴 시점 화면 갱신 after ID (키 반복 입력 묶음)
+        # 설정 파일은 직접 수정할 수 있으므로 숫자가 아니면 기본값 사용
+        try:
+            max_redraw_hz = int(self.cfg.get("max_redraw_hz", self._MAX_REDRAW_HZ))
+        except (TypeError, ValueError):
+            max_redraw_hz = self._MAX_REDRAW_HZ
+        self._fifth_min_interval = 1.0 / max(1, max_redraw_hz)
+        
+        # Supabase 동기화 상태
+        self._last_sent_secs = None  # 마지막으로 동기화한 (게임 시간, 샷 클럭) 정수 초
+        self._last_sync_t = 0.0  # 마지막 동기화 시각 (time.monotonic)
+        self.last_score_data = None  # 마지막으로 전송한 데이터 (None이면 다음 전송은 전체 upsert)
+        self._last_fp = None  # 마지막으로 전송한 상태의 지문 (같으면 딕셔너리 생성/비교 생략)
+        self._supabase_dirty = False  # 다음 주기 동기화 때 전송할 변경사항 여부
+        # last_score_data/_last_fp는 전송 실패 시 워커 스레드도 초기화하므로 잠금으로 보호
+        self._sync_lock = threading.Lock()
+        
+        # Supabase 전송 워커 (대기열은 최신 스냅샷 1개만 유지)
+        self._sync_q = queue.Queue(maxsize=1)
+        self._sync_thread = None
+        if self.supabase_client:
+            self._sync_thread = threading.Thread(target=self._sync_worker, daemon=True)
+            self._sync_thread.start()
+        
+        # 설정 저장 예약 ID (연속 변경은 한 번의 저장으로 합침)
+        self._save_after_id = None
+        # 설정 파일 쓰기 워커 (대기열은 최신 스냅샷 1개만 유지)
+        self._cfg_q = queue.Queue(maxsize=1)
+        self._cfg_thread = threading.Thread(target=self._cfg_writer, daemon=True)
+        self._cfg_thread.start()
+        
+        # 설정 창 (처음 열 때 한 번 만들고 이후에는 값만 다시 채워서 표시)
+        self._settings_window = None
+        self._settings_refresh = None
         
         # 사운드 재생 플래그 (중복 재생 방지)
         self.game_buzzer_played = False
         self.shot_buzzer_played = False
         
-        # pygame 사운드 초기화
-        try:
-            pygame.mixer.init()
-            buzzer_path = os.path.join(os.path.dirname(__file__), "sound", "buzzer_main.wav")
-            self.buzzer_sound = pygame.mixer.Sound(buzzer_path)
-            print(f"버저 사운드 로드 성공: {buzzer_path}")
-        except Exception as e:
-            print(f"사운드 초기화 실패: {e}")
-            self.buzzer_sound = None
+        # pygame 사운드 (프로세스당 한 번만 로드)
+        self.buzzer = load_buzzer()
         
         # Tkinter 루트
         self.root = tk.Tk()
         self.root.withdraw()  # 메인 창 숨기기
         
+        # 화면 크기와 프레젠테이션 창 위치는 한 번만 조회 (winfo_screen*은 X 서버 왕복)
+        self._screen_w = self.root.winfo_screenwidth()
+        self._screen_h = self.root.winfo_screenheight()
+        self._pres_geometry = {
+            True: "1920x1080+0+0",  # 전환 모드: 첫 번째 모니터
+            False: f"1920x1080+{self._screen_w}+0",  # 기본 모드: 두 번째 모니터
+        }
+        
         # 폰트 설정
         self.setup_fonts()
         
         # 창 생성
+        self._has_pres = False  # 프레젠테이션 창 표시 여부 (매 프레임 hasattr 대신 사용)
+        self._has_control = False  # 조작용 창 재생 버튼 생성 여부
+        self._pres_built = False  # 프레젠테이션 창은 처음 필요할 때 한 번만 생성
+        self._create_display_vars()
         self.create_control_window()
         
         if self.cfg.get("dual_monitor", False):
-            self.create_presentation_window()
+            self.show_presentation_window()
         
         # 타이머 시작
         self.start_timer()
         
-        # 키보드 바인딩
+        # 키보드 바인딩 (키 -> 인자를 미리 묶은 호출 가능 객체)
+        self._key_dispatch = {key: self._bind_action(method, args)
+                              for key, (method, args) in self._KEY_ACTIONS.items()}
         self.setup_keyboard_bindings()
         
         # 초기 데이터를 Supabase에 전송
@@ -523,74 +929,60 @@ class DualMonitorScoreboard:
         # 팀 로고 가져오기
         team1_id = game_data.get("team1_id")
         team2_id = game_data.get("team2_id")
-        print(f"game_league에서 가져온 team1_id: {team1_id}, team2_id: {team2_id}")
+        dlog("game_league에서 가져온 team1_id: %s, team2_id: %s", team1_id, team2_id)
         
-        self.team1_logo = self.get_team_logo(team1_id)
-        self.team2_logo = self.get_team_logo(team2_id)
+        logos = self.get_team_logos([team1_id, team2_id])
+        self.team1_logo = logos.get(team1_id)
+        self.team2_logo = logos.get(team2_id)
         
         print(f"게임 로드: {self.teamA_name} vs {self.teamB_name}")
-        print(f"점수: {self.scoreA} - {self.scoreB}")
-        print(f"팀 컬러: {self.team1_color} / {self.team2_color}")
-        print(f"팀 로고: {self.team1_logo} / {self.team2_logo}")
+        dlog("점수: %s - %s", self.scoreA, self.scoreB)
+        dlog("팀 컬러: %s / %s", self.team1_color, self.team2_color)
+        dlog("팀 로고: %s / %s", self.team1_logo, self.team2_logo)
     
     def get_broadcast_channel(self):
-        """방송 채널 전체 주소 반환 (웹 뷰어 URL + 채널 ID)"""
-        if WEB_VIEWER_URL:
-            # URL 끝의 슬래시 제거
-            base_url = WEB_VIEWER_URL.rstrip('/')
-            return f"{base_url}/{self.game_id}"
-        else:
-            # 웹 뷰어 URL이 없으면 채널 ID만 반환
-            return self.game_id
+        """방송 채널 전체 주소 반환 (웹 뷰어 URL + 채널 ID, 창 크기 변경마다 다시 만들지 않도록 캐시)"""
+        if self._broadcast_channel is None:
+            if WEB_VIEWER_URL:
+                # URL 끝의 슬래시 제거
+                base_url = WEB_VIEWER_URL.rstrip('/')
+                self._broadcast_channel = f"{base_url}/{self.game_id}"
+            else:
+                # 웹 뷰어 URL이 없으면 채널 ID만 반환
+                self._broadcast_channel = self.game_id
+        return self._broadcast_channel
     
-    def get_team_logo(self, team_id):
-        """팀 ID로 로고 URL 가져오기"""
-        if not team_id:
-            print(f"팀 ID가 없음: {team_id}")
-            return None
+    def get_team_logos(self, team_ids):
+        """팀 ID 목록으로 로고 URL을 한 번에 조회 ({team_id: logo_url})"""
+        ids = [team_id for team_id in team_ids if team_id]
+        if not ids:
+            dlog("팀 ID가 없음: %s", team_ids)
+            return {}
         
         if not self.supabase_client:
-            print("Supabase 클라이언트가 없음")
-            return None
+            dlog("Supabase 클라이언트가 없음")
+            return {}
         
         try:
-            print(f"팀 로고 조회 시작: team_id={team_id}, type={type(team_id)}")
-            response = self.supabase_client.table('teams').select('team_logo').eq('id', team_id).execute()
-            print(f"조회 결과: {response.data}")
-            
-            if response.data and len(response.data) > 0:
-                logo_url = response.data[0].get('team_logo')
-                print(f"팀 로고 찾음: {logo_url}")
-                return logo_url
-            else:
-                print(f"팀 로고를 찾을 수 없음: team_id={team_id}")
+            dlog("팀 로고 조회 시작: team_ids=%s", ids)
+            response = self.supabase_client.table('teams').select('id, team_logo').in_('id', ids).execute()
+            dlog("조회 결과: %s", response.data)
+            
+            logos = {row['id']: row.get('team_logo') for row in (response.data or [])}
+            for team_id in ids:
+                if team_id not in logos:
+                    dlog("팀 로고를 찾을 수 없음: team_id=%s", team_id)
+            return logos
         except Exception as e:
             print(f"팀 로고 조회 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            if DEBUG:
+                traceback.print_exc()
         
-        return None
+        return {}
     
     def get_color_hex(self, color_value):
         """색상 값을 hex 코드로 변환"""
-        if not color_value:
-            return "#F4F4F4"  # 기본값: 흰색
-        
-        # 이미 hex 코드인 경우 (#로 시작)
-        if isinstance(color_value, str) and color_value.startswith('#'):
-            return color_value
-        
-        # 색상 이름인 경우 hex로 변환 (하위 호환성)
-        color_map = {
-            "white": "#F4F4F4",
-            "red": "#EF4444", 
-            "blue": "#2563EB",
-            "yellow": "#FACC15",
-            "green": "#22C55E",
-            "lightgreen": "#22C55E",
-            "black": "#222222"
-        }
-        return color_map.get(color_value, "#F4F4F4")
+        return color_to_hex(color_value)
     
     def get_score_data(self):
         """현재 게임 상태를 딕셔너리로 반환"""
@@ -609,9 +1001,9 @@ class DualMonitorScoreboard:
             'team1_timeouts': self.timeoutsA,
             'team2_timeouts': self.timeoutsB,
             'current_quarter': self.period,
-            'quarter_time': fmt_mmss(self.game_seconds),
+            'quarter_time': fmt_mmss(self.game_ms // 1000),
             'game_status': self.game_status,
-            'shot_clock': int(self.shot_seconds),  # 24초 필드 추가
+            'shot_clock': self.shot_ms // 1000,  # 24초 필드 추가
             'team1_color': self.get_color_hex(team1_color_value),
             'team2_color': self.get_color_hex(team2_color_value),
             # 로고 정보 항상 추가 (없으면 None으로 명시적으로 전송하여 이전 값 제거)
@@ -621,35 +1013,159 @@ class DualMonitorScoreboard:
         
         return data
     
+    def _fingerprint(self):
+        """get_score_data에 들어가는 값들의 해시 (정수 비교로 변경 여부 판단)"""
+        return hash((
+            self.game_id, self.teamA_name, self.teamB_name,
+            self.scoreA, self.scoreB, self.foulsA, self.foulsB, self.timeoutsA, self.timeoutsB,
+            self.period, self.game_ms // 1000, self.shot_ms // 1000, self.game_status,
+            getattr(self, 'team1_color', None), getattr(self, 'team2_color', None),
+            self.cfg.get("team_a_color"), self.cfg.get("team_b_color"),
+            getattr(self, 'team1_logo', None), getattr(self, 'team2_logo', None),
+        ))
+    
+    def _mark_dirty(self):
+        """변경사항을 표시만 하고 전송은 타이머 주기 동기화에 맡김 (연속 조작은 한 번에 전송)"""
+        self._supabase_dirty = True
+    
     def update_supabase_data(self):
         """Supabase에 현재 게임 데이터 업데이트 (변경사항이 있을 때만)"""
+        self._supabase_dirty = False
         if not self.supabase_client:
             return
         
         try:
-            score_data = self.get_score_data()
+            # 지문이 같으면 변경사항 없음
+            fp = self._fingerprint()
+            with self._sync_lock:
+                if fp == self._last_fp:
+                    return
+                self._last_fp = fp
+                score_data = self.get_score_data()
+                
+                # 이전 데이터와 비교 (변경사항이 있을 때만 업데이트)
+                prev = self.last_score_data
+                if prev == score_data:
+                    return
+                self.last_score_data = score_data
             
-            # 이전 데이터와 비교 (변경사항이 있을 때만 업데이트)
-            if self.last_score_data != score_data:
-                success = update_live_score_to_supabase(self.supabase_client, self.game_id, score_data)
-                if success:
-                    # print(f"Supabase 업데이트 성공: {self.game_id}")  # 로그 최소화
-                    self.last_score_data = score_data.copy()
-                else:
-                    print(f"Supabase 업데이트 실패: {self.game_id}")
+            if prev is None or prev.get('game_id') != score_data['game_id']:
+                # 첫 전송 또는 게임 ID 변경: 전체 행 upsert
+                self._enqueue_sync(score_data, full=True)
+            else:
+                # 바뀐 컬럼만 전송
+                changes = {k: v for k, v in score_data.items() if prev.get(k) != v}
+                changes['game_id'] = score_data['game_id']
+                self._enqueue_sync(changes)
         except Exception as e:
             print(f"Supabase 업데이트 중 오류: {e}")
     
+    def _enqueue_sync(self, score_data, full=False):
+        """전송 대기열에 스냅샷 추가 (아직 전송되지 않은 이전 스냅샷은 새 값으로 덮어씀)"""
+        try:
+            pending = self._sync_q.get_nowait()
+            # 대기 중이던 컬럼이 빠지지 않도록 합침 (둘 중 하나라도 전체 전송이면 전체 전송)
+            if pending:
+                pending_full, pending_data = pending
+                score_data = {**pending_data, **score_data}
+                full = full or pending_full
+        except queue.Empty:
+            pass
+        self._sync_q.put_nowait((full, score_data))
+    
+    def request_save_cfg(self, delay_ms=500):
+        """설정 저장 예약 (delay_ms 안에 다시 요청되면 한 번만 저장)"""
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(delay_ms, self._enqueue_cfg_write)
+    
+    def _enqueue_cfg_write(self):
+        """설정 스냅샷을 쓰기 대기열에 추가 (아직 쓰지 않은 이전 스냅샷은 새 값으로 덮어씀)"""
+        self._save_after_id = None
+        try:
+            self._cfg_q.get_nowait()
+        except queue.Empty:
+            pass
+        self._cfg_q.put_nowait(dict(self.cfg))
+    
+    def flush_save_cfg(self, timeout=1.0):
+        """예약된 저장을 바로 대기열에 넣고, 쓰기가 끝날 때까지 기다린 뒤 워커 종료 (창을 닫을 때 호출)"""
+        if not self._cfg_thread:
+            return
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._enqueue_cfg_write()
+        try:
+            self._cfg_q.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._cfg_thread.join(timeout)
+        self._cfg_thread = None
+    
+    def _cfg_writer(self):
+        """백그라운드에서 설정 파일 쓰기 (UI 스레드를 막지 않음, None을 받으면 종료)"""
+        while True:
+            cfg = self._cfg_q.get()
+            if cfg is None:
+                return
+            save_cfg(cfg)
+    
+    def _stop_sync_worker(self, timeout=2.0):
+        """대기 중인 마지막 스냅샷을 전송한 뒤 워커 종료 (최대 timeout초 대기)"""
+        if not self._sync_thread:
+            return
+        try:
+            self._sync_q.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._sync_thread.join(timeout)
+        self._sync_thread = None
+    
+    def _sync_worker(self):
+        """백그라운드에서 Supabase 전송 (UI 스레드를 막지 않음, None을 받으면 종료)"""
+        while True:
+            item = self._sync_q.get()
+            if item is None:
+                return
+            full, score_data = item
+            if not update_live_score_to_supabase(self.supabase_client, score_data['game_id'], score_data, full):
+                print(f"Supabase 업데이트 실패: {score_data['game_id']}")
+                # 다음 동기화 때 전체 행을 다시 upsert하도록 비교 기준 초기화
+                # (시계가 멈춰 있어도 다음 주기에 재전송되도록 변경사항 표시)
+                with self._sync_lock:
+                    self.last_score_data = None
+                    self._last_fp = None
+                    self._supabase_dirty = True
+    
     def setup_fonts(self):
         """폰트 설정"""
+        self._fonts = {}  # 키별 Font 객체 (재설정 시 새로 만들지 않고 configure)
         # 반응형 폰트 크기 계산
         self.setup_responsive_fonts()
+        self.setup_button_styles()
+    
+    def setup_button_styles(self):
+        """조작 버튼용 ttk 스타일 (버튼마다 색/폰트 옵션을 주지 않고 스타일 이름으로 공유)"""
+        style = ttk.Style(self.root)
+        style.configure("Scoreboard.TButton", font=self.font_small)
+        for fg, style_name in self._BUTTON_STYLES.items():
+            if fg:
+                style.configure(style_name, foreground=fg)
+    
+    def _font(self, key, **kw):
+        """키에 해당하는 Font를 재사용 (이미 있으면 속성만 변경 -> 사용 중인 위젯에 즉시 반영)"""
+        f = self._fonts.get(key)
+        if f is None:
+            f = self._fonts[key] = font.Font(**kw)
+        else:
+            f.configure(**kw)
+        return f
     
     def setup_responsive_fonts(self):
         """반응형 폰트 크기 설정"""
-        # 화면 크기 감지
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
+        # 화면 크기
+        screen_width = self._screen_w
+        screen_height = self._screen_h
         
         # 기준 해상도 (1920x1080)
         base_width = 1920
@@ -664,31 +1180,46 @@ class DualMonitorScoreboard:
         
         if self.small_screen:
             # 작은 화면 모드 (726x416): 창 크기는 그대로, 폰트만 1.2배 증가
-            self.font_large = font.Font(family="Arial", size=19, weight="bold")  # 16 * 1.2
-            self.font_medium = font.Font(family="Arial", size=12)  # 10 * 1.2
-            self.font_small = font.Font(family="Arial", size=10)  # 8 * 1.2 (반올림)
-            self.font_score = font.Font(family="Arial", size=38, weight="bold")  # 32 * 1.2
-            self.font_time = font.Font(family="Arial", size=24, weight="bold")  # 20 * 1.2
+            self.font_large = self._font("font_large", family="Arial", size=19, weight="bold")  # 16 * 1.2
+            self.font_medium = self._font("font_medium", family="Arial", size=12)  # 10 * 1.2
+            self.font_small = self._font("font_small", family="Arial", size=10)  # 8 * 1.2 (반올림)
+            self.font_score = self._font("font_score", family="Arial", size=38, weight="bold")  # 32 * 1.2
+            self.font_time = self._font("font_time", family="Arial", size=24, weight="bold")  # 20 * 1.2
         else:
             # 일반 화면 모드: 반응형 컨트롤 창 폰트
-            self.font_large = font.Font(family="Arial", size=int(48 * font_ratio), weight="bold")
-            self.font_medium = font.Font(family="Arial", size=int(24 * font_ratio))
-            self.font_small = font.Font(family="Arial", size=int(16 * font_ratio))
-            self.font_score = font.Font(family="Arial", size=int(72 * font_ratio), weight="bold")
-            self.font_time = font.Font(family="Arial", size=int(36 * font_ratio), weight="bold")
+            self.font_large = self._font("font_large", family="Arial", size=int(48 * font_ratio), weight="bold")
+            self.font_medium = self._font("font_medium", family="Arial", size=int(24 * font_ratio))
+            self.font_small = self._font("font_small", family="Arial", size=int(16 * font_ratio))
+            self.font_score = self._font("font_score", family="Arial", size=int(72 * font_ratio), weight="bold")
+            self.font_time = self._font("font_time", family="Arial", size=int(36 * font_ratio), weight="bold")
         
         # 프레젠테이션용 폰트 (항상 큰 화면용, small_screen과 무관)
-        self.pres_font_team = font.Font(family="Arial", size=int(90 * font_ratio), weight="bold")  # 120 → 90
-        self.pres_font_score = font.Font(family="Arial", size=int(300 * font_ratio), weight="bold")  # 400 → 300
-        self.pres_font_time = font.Font(family="Arial", size=int(120 * font_ratio), weight="bold")  # 160 → 120 (분:초용)
-        self.pres_font_time_small = font.Font(family="Arial", size=int(90 * font_ratio), weight="bold")  # 120 * 0.75 = 90 (1/5초용)
-        self.pres_font_shot = font.Font(family="Arial", size=int(150 * font_ratio), weight="bold")  # 200 → 150
-        self.pres_font_period = font.Font(family="Arial", size=int(90 * font_ratio), weight="bold")  # 120 → 90
-        self.pres_font_stats = font.Font(family="Arial", size=int(60 * font_ratio), weight="bold")  # 80 → 60
+        self.pres_font_team = self._font("pres_font_team", family="Arial", size=int(90 * font_ratio), weight="bold")  # 120 → 90
+        self.pres_font_score = self._font("pres_font_score", family="Arial", size=int(300 * font_ratio), weight="bold")  # 400 → 300
+        self.pres_font_time = self._font("pres_font_time", family="Arial", size=int(120 * font_ratio), weight="bold")  # 160 → 120 (분:초용)
+        self.pres_font_time_small = self._font("pres_font_time_small", family="Arial", size=int(90 * font_ratio), weight="bold")  # 120 * 0.75 = 90 (1/5초용)
+        self.pres_font_shot = self._font("pres_font_shot", family="Arial", size=int(150 * font_ratio), weight="bold")  # 200 → 150
+        self.pres_font_period = self._font("pres_font_period", family="Arial", size=int(90 * font_ratio), weight="bold")  # 120 → 90
+        self.pres_font_stats = self._font("pres_font_stats", family="Arial", size=int(60 * font_ratio), weight="bold")  # 80 → 60
+        
+        # 힌트/설정 창 안내문용 고정 크기 폰트
+        self.font_hint = self._font("font_hint", family="Arial", size=8)
+        self.font_note = self._font("font_note", family="Arial", size=9)
+        
+        # 폰트 메트릭을 미리 계산해 첫 화면 그리기 때 지연 방지
+        for f in self._fonts.values():
+            f.metrics("linespace")
+    
+    def _control_window_offset(self):
+        """모니터 전환 설정에 따른 조작용 창 위치 ("+x+y")"""
+        if self.cfg.get("swap_monitors", False):
+            return "+1920+0"  # 전환 모드: 조작용 창을 두 번째 모니터에
+        return "+0+0"  # 기본 모드: 조작용 창을 첫 번째 모니터에
     
     def create_control_window(self):
         """조작용 창 생성 (모니터 전환 기능 포함)"""
         self.control_window = tk.Toplevel(self.root)
+        self.control_window.withdraw()  # 위젯을 모두 배치한 뒤 한 번에 표시 (중간 상태 그리기 방지)
         self.control_window.title(f"Novato Scoreboard - {self.get_broadcast_channel()}")
         
         if self.small_screen:
@@ -697,28 +1228,17 @@ class DualMonitorScoreboard:
             control_height = 416
             self.control_window.resizable(False, False)  # 크기 고정
             # 작은 화면은 해당 모니터의 좌측 상단에 고정
-            if self.cfg.get("swap_monitors", False):
-                self.control_window.geometry(f"{control_width}x{control_height}+1920+0")
-            else:
-                self.control_window.geometry(f"{control_width}x{control_height}+0+0")
+            self.control_window.geometry(f"{control_width}x{control_height}{self._control_window_offset()}")
         else:
             # 일반 화면 모드: 반응형 창 크기
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
-            
             # 조작용 창 크기 (화면 크기에 비례)
-            control_width = max(800, min(1200, int(screen_width * 0.6)))
-            control_height = max(600, min(900, int(screen_height * 0.7)))
+            control_width = max(800, min(1200, int(self._screen_w * 0.6)))
+            control_height = max(600, min(900, int(self._screen_h * 0.7)))
             
             self.control_window.resizable(True, True)
             
             # 일반 화면은 모니터 전환 기능 적용
-            if self.cfg.get("swap_monitors", False):
-                # 전환 모드: 조작용 창을 두 번째 모니터에
-                self.control_window.geometry(f"{control_width}x{control_height}+1920+0")  # 두 번째 모니터
-            else:
-                # 기본 모드: 조작용 창을 첫 번째 모니터에
-                self.control_window.geometry(f"{control_width}x{control_height}+0+0")  # 첫 번째 모니터
+            self.control_window.geometry(f"{control_width}x{control_height}{self._control_window_offset()}")
             
         self.control_window.configure(bg='#1a1a1a')
         
@@ -740,56 +1260,11 @@ class DualMonitorScoreboard:
         # 컨트롤 창 팀 순서 확인
         is_swapped = self.cfg.get("control_team_swapped", False)
         
-        # 왼쪽 팀 프레임
+        # 왼쪽 팀 프레임 (기본은 A팀, 바뀐 경우 B팀)
+        left_team, right_team = ('B', 'A') if is_swapped else ('A', 'B')
         left_team_frame = tk.Frame(score_frame, bg='#1a1a1a')
         left_team_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        if is_swapped:
-            # B팀이 왼쪽
-            self.team_b_label = tk.Label(left_team_frame, text=self.teamB_name, 
-                                        font=self.font_medium, fg='white', bg='#1a1a1a')
-            self.team_b_label.pack()
-            
-            self.score_b_label = tk.Label(left_team_frame, text=str(self.scoreB), 
-                                         font=self.font_score, fg='white', bg='#1a1a1a')
-            self.score_b_label.pack()
-            
-            # B팀 타임아웃/파울
-            b_stats_row = tk.Frame(left_team_frame, bg='#1a1a1a')
-            b_stats_row.pack(pady=(10, 0))
-            
-            tk.Label(b_stats_row, text="TO", font=self.font_small, fg='white', bg='#1a1a1a').pack(side=tk.LEFT, padx=(0, 5))
-            self.timeout_b_label = tk.Label(b_stats_row, text=str(self.timeoutsB), 
-                                           font=self.font_medium, fg='white', bg='#1a1a1a')
-            self.timeout_b_label.pack(side=tk.LEFT, padx=(0, 15))
-            
-            tk.Label(b_stats_row, text="F", font=self.font_small, fg='white', bg='#1a1a1a').pack(side=tk.LEFT, padx=(0, 5))
-            self.foul_b_label = tk.Label(b_stats_row, text=str(self.foulsB), 
-                                        font=self.font_medium, fg='white', bg='#1a1a1a')
-            self.foul_b_label.pack(side=tk.LEFT)
-        else:
-            # A팀이 왼쪽 (기본)
-            self.team_a_label = tk.Label(left_team_frame, text=self.teamA_name, 
-                                        font=self.font_medium, fg='white', bg='#1a1a1a')
-            self.team_a_label.pack()
-            
-            self.score_a_label = tk.Label(left_team_frame, text=str(self.scoreA), 
-                                         font=self.font_score, fg='white', bg='#1a1a1a')
-            self.score_a_label.pack()
-            
-            # A팀 타임아웃/파울
-            a_stats_row = tk.Frame(left_team_frame, bg='#1a1a1a')
-            a_stats_row.pack(pady=(10, 0))
-            
-            tk.Label(a_stats_row, text="TO", font=self.font_small, fg='white', bg='#1a1a1a').pack(side=tk.LEFT, padx=(0, 5))
-            self.timeout_a_label = tk.Label(a_stats_row, text=str(self.timeoutsA), 
-                                           font=self.font_medium, fg='white', bg='#1a1a1a')
-            self.timeout_a_label.pack(side=tk.LEFT, padx=(0, 15))
-            
-            tk.Label(a_stats_row, text="F", font=self.font_small, fg='white', bg='#1a1a1a').pack(side=tk.LEFT, padx=(0, 5))
-            self.foul_a_label = tk.Label(a_stats_row, text=str(self.foulsA), 
-                                        font=self.font_medium, fg='white', bg='#1a1a1a')
-            self.foul_a_label.pack(side=tk.LEFT)
+        self._build_side(left_team_frame, left_team)
         
         # 중앙 (시간, 쿼터, 샷클럭)
         center_frame = tk.Frame(score_frame, bg='#1a1a1a')
@@ -799,7 +1274,7 @@ class DualMonitorScoreboard:
         time_frame = tk.Frame(center_frame, bg='#1a1a1a')
         time_frame.pack(pady=2)
         
-        self.time_label = tk.Label(time_frame, text=fmt_mmss_centi(self.game_seconds), 
+        self.time_label = tk.Label(time_frame, textvariable=self._vars['time'], 
                                   font=self.font_time, fg='white', bg='#1a1a1a')
         self.time_label.pack()
         
@@ -807,7 +1282,7 @@ class DualMonitorScoreboard:
         period_frame = tk.Frame(center_frame, bg='#1a1a1a')
         period_frame.pack(pady=1)
         
-        self.period_label = tk.Label(period_frame, text=f"Q{self.period}", 
+        self.period_label = tk.Label(period_frame, textvariable=self._vars['period'], 
                                     font=self.font_medium, fg='yellow', bg='#1a1a1a')
         self.period_label.pack()
         
@@ -815,60 +1290,14 @@ class DualMonitorScoreboard:
         shot_frame = tk.Frame(center_frame, bg='#1a1a1a')
         shot_frame.pack(pady=1)
         
-        self.shot_label = tk.Label(shot_frame, text=str(int(self.shot_seconds)), 
+        self.shot_label = tk.Label(shot_frame, textvariable=self._vars['shot'], 
                                   font=self.font_time, fg='orange', bg='#1a1a1a')
         self.shot_label.pack()
         
         # 오른쪽 팀 프레임
         right_team_frame = tk.Frame(score_frame, bg='#1a1a1a')
         right_team_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
-        
-        if is_swapped:
-            # A팀이 오른쪽
-            self.team_a_label = tk.Label(right_team_frame, text=self.teamA_name, 
-                                        font=self.font_medium, fg='white', bg='#1a1a1a')
-            self.team_a_label.pack()
-            
-            self.score_a_label = tk.Label(right_team_frame, text=str(self.scoreA), 
-                                         font=self.font_score, fg='white', bg='#1a1a1a')
-            self.score_a_label.pack()
-            
-            # A팀 타임아웃/파울
-            a_stats_row = tk.Frame(right_team_frame, bg='#1a1a1a')
-            a_stats_row.pack(pady=(10, 0))
-            
-            tk.Label(a_stats_row, text="TO", font=self.font_small, fg='white', bg='#1a1a1a').pack(side=tk.LEFT, padx=(0, 5))
-            self.timeout_a_label = tk.Label(a_stats_row, text=str(self.timeoutsA), 
-                                           font=self.font_medium, fg='white', bg='#1a1a1a')
-            self.timeout_a_label.pack(side=tk.LEFT, padx=(0, 15))
-            
-            tk.Label(a_stats_row, text="F", font=self.font_small, fg='white', bg='#1a1a1a').pack(side=tk.LEFT, padx=(0, 5))
-            self.foul_a_label = tk.Label(a_stats_row, text=str(self.foulsA), 
-                                        font=self.font_medium, fg='white', bg='#1a1a1a')
-            self.foul_a_label.pack(side=tk.LEFT)
-        else:
-            # B팀이 오른쪽 (기본)
-            self.team_b_label = tk.Label(right_team_frame, text=self.teamB_name, 
-                                        font=self.font_medium, fg='white', bg='#1a1a1a')
-            self.team_b_label.pack()
-            
-            self.score_b_label = tk.Label(right_team_frame, text=str(self.scoreB), 
-                                         font=self.font_score, fg='white', bg='#1a1a1a')
-            self.score_b_label.pack()
-            
-            # B팀 타임아웃/파울
-            b_stats_row = tk.Frame(right_team_frame, bg='#1a1a1a')
-            b_stats_row.pack(pady=(10, 0))
-            
-            tk.Label(b_stats_row, text="TO", font=self.font_small, fg='white', bg='#1a1a1a').pack(side=tk.LEFT, padx=(0, 5))
-            self.timeout_b_label = tk.Label(b_stats_row, text=str(self.timeoutsB), 
-                                           font=self.font_medium, fg='white', bg='#1a1a1a')
-            self.timeout_b_label.pack(side=tk.LEFT, padx=(0, 15))
-            
-            tk.Label(b_stats_row, text="F", font=self.font_small, fg='white', bg='#1a1a1a').pack(side=tk.LEFT, padx=(0, 5))
-            self.foul_b_label = tk.Label(b_stats_row, text=str(self.foulsB), 
-                                        font=self.font_medium, fg='white', bg='#1a1a1a')
-            self.foul_b_label.pack(side=tk.LEFT)
+        self._build_side(right_team_frame, right_team)
         
         # 조작 버튼들
         self.create_control_buttons(main_frame)
@@ -878,11 +1307,69 @@ class DualMonitorScoreboard:
             self.create_hints(main_frame)
             # 창이 완전히 렌더링된 후 크기 업데이트
             self.control_window.after(100, self.update_hints_text)
-            # 창 크기 변경 시 힌트 텍스트 업데이트
-            self.control_window.bind('<Configure>', lambda e: self.update_hints_text())
+            # 창 크기 변경 시 힌트 텍스트 업데이트 (연속 이벤트는 합쳐서 한 번만)
+            self.control_window.bind('<Configure>', self._on_control_configure)
         else:
             # 작은 화면용 간단한 힌트
             self.create_simple_hints(main_frame)
+        
+        # 배치 계산을 한 번에 끝낸 뒤 창 표시
+        self.control_window.update_idletasks()
+        self.control_window.deiconify()
+        self._reset_display_cache()
+    
+    def _build_side(self, parent, team):
+        """조작용 창 한 팀 영역 (팀 이름, 점수, 타임아웃/파울) 생성 - team은 'A' 또는 'B'"""
+        t = team.lower()
+        v = self._vars
+        team_label = tk.Label(parent, textvariable=v[f"team{team}"], 
+                             font=self.font_medium, fg='white', bg='#1a1a1a')
+        team_label.pack()
+        
+        score_label = tk.Label(parent, textvariable=v[f"score{team}"], 
+                              font=self.font_score, fg='white', bg='#1a1a1a')
+        score_label.pack()
+        
+        # 타임아웃/파울
+        stats_row = tk.Frame(parent, bg='#1a1a1a')
+        stats_row.pack(pady=(10, 0))
+        
+        tk.Label(stats_row, text="TO", font=self.font_small, fg='white', bg='#1a1a1a').pack(side=tk.LEFT, padx=(0, 5))
+        timeout_label = tk.Label(stats_row, textvariable=v[f"timeouts{team}"], 
+                                font=self.font_medium, fg='white', bg='#1a1a1a')
+        timeout_label.pack(side=tk.LEFT, padx=(0, 15))
+        
+        tk.Label(stats_row, text="F", font=self.font_small, fg='white', bg='#1a1a1a').pack(side=tk.LEFT, padx=(0, 5))
+        foul_label = tk.Label(stats_row, textvariable=v[f"fouls{team}"], 
+                             font=self.font_medium, fg='white', bg='#1a1a1a')
+        foul_label.pack(side=tk.LEFT)
+        
+        setattr(self, f"team_{t}_label", team_label)
+        setattr(self, f"score_{t}_label", score_label)
+        setattr(self, f"timeout_{t}_label", timeout_label)
+        setattr(self, f"foul_{t}_label", foul_label)
+    
+    def _bind_action(self, method, args):
+        """(메서드 이름, 인자) 정의 -> 인자를 미리 묶은 호출 가능 객체 (인자가 없으면 바운드 메서드 그대로)"""
+        fn = getattr(self, method)
+        return partial(fn, *args) if args else fn
+    
+    def _make_buttons(self, parent, rows, padx=2, pady=0, column=0, **opts):
+        """버튼 정의 표 (줄마다 (텍스트, 메서드 이름, 인자, 글자색))로 버튼을 parent에 grid로 직접 배치"""
+        for r, specs in enumerate(rows):
+            for c, (text, method, args, fg) in enumerate(specs, column):
+                ttk.Button(parent, text=text, command=self._bind_action(method, args),
+                          style=self._BUTTON_STYLES[fg], **opts).grid(row=r, column=c, padx=padx, pady=pady)
+    
+    def _titled_frame(self, parent, title, fg, **pack_opts):
+        """제목 라벨 + 내용 Frame (테두리 없는 LabelFrame 대용) -> 버튼을 grid로 가운데 배치할 내용 Frame"""
+        outer = tk.Frame(parent, bg='#1a1a1a', highlightthickness=0, borderwidth=0)
+        outer.pack(**pack_opts)
+        tk.Label(outer, text=title, font=self.font_small, fg=fg, bg='#1a1a1a').pack(anchor=tk.W)
+        body = tk.Frame(outer, bg='#1a1a1a', highlightthickness=0, borderwidth=0)
+        body.pack(fill=tk.BOTH, expand=True)
+        body.grid_anchor(tk.CENTER)  # 버튼 중앙 정렬
+        return body
     
     def create_control_buttons(self, parent):
         """조작 버튼들 생성"""
@@ -890,229 +1377,66 @@ class DualMonitorScoreboard:
         button_frame = tk.Frame(parent, bg='#1a1a1a')
         button_frame.pack(fill=tk.X, pady=pady_spacing)
         
-        # A팀 점수
-        a_team_frame = tk.LabelFrame(button_frame, text="A팀 점수", 
-                                    font=self.font_small, fg='lightblue', bg='#1a1a1a')
-        a_team_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
-        
-        # 버튼 중앙 정렬을 위한 컨테이너
-        a_score_container = tk.Frame(a_team_frame, bg='#1a1a1a')
-        a_score_container.pack(expand=True)
-        
-        tk.Button(a_score_container, text="+1 (1)", command=lambda: self.update_score('A', 1),
-                 font=self.font_small).pack(side=tk.LEFT, padx=2)
-        tk.Button(a_score_container, text="+2 (2)", command=lambda: self.update_score('A', 2),
-                 font=self.font_small).pack(side=tk.LEFT, padx=2)
-        tk.Button(a_score_container, text="+3 (3)", command=lambda: self.update_score('A', 3),
-                 font=self.font_small).pack(side=tk.LEFT, padx=2)
-        tk.Button(a_score_container, text="-1 (`)", command=lambda: self.update_score('A', -1),
-                 font=self.font_small).pack(side=tk.LEFT, padx=2)
-        
-        # B팀 점수
-        b_team_frame = tk.LabelFrame(button_frame, text="B팀 점수", 
-                                    font=self.font_small, fg='lightcoral', bg='#1a1a1a')
-        b_team_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
-        
-        # 버튼 중앙 정렬을 위한 컨테이너
-        b_score_container = tk.Frame(b_team_frame, bg='#1a1a1a')
-        b_score_container.pack(expand=True)
-        
-        tk.Button(b_score_container, text="+1 (0)", command=lambda: self.update_score('B', 1),
-                 font=self.font_small).pack(side=tk.LEFT, padx=2)
-        tk.Button(b_score_container, text="+2 (9)", command=lambda: self.update_score('B', 2),
-                 font=self.font_small).pack(side=tk.LEFT, padx=2)
-        tk.Button(b_score_container, text="+3 (8)", command=lambda: self.update_score('B', 3),
-                 font=self.font_small).pack(side=tk.LEFT, padx=2)
-        tk.Button(b_score_container, text="-1 (-)", command=lambda: self.update_score('B', -1),
-                 font=self.font_small).pack(side=tk.LEFT, padx=2)
-        
+        # 팀 점수 (A팀 왼쪽, B팀 오른쪽)
+        for team, side, padx, fg in (('A', tk.LEFT, (0, 5), 'lightblue'), ('B', tk.RIGHT, (5, 0), 'lightcoral')):
+            team_frame = self._titled_frame(button_frame, f"{team}팀 점수", fg,
+                                            side=side, fill=tk.BOTH, expand=True, padx=padx)
+            self._make_buttons(team_frame, (self._SCORE_BTNS[team],))
         
         # 팀 제어 (점수 제어 다음 줄)
         team_control_frame = tk.Frame(parent, bg='#1a1a1a')
         team_control_frame.pack(fill=tk.X, pady=(0, 10))
         
-        # A팀 제어
-        a_control_frame = tk.LabelFrame(team_control_frame, text="A팀 제어", 
-                                       font=self.font_small, fg='lightblue', bg='#1a1a1a')
-        a_control_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
-        
-        # 첫 번째 줄: 타임아웃 +1, 파울 -1 (빨간색)
-        a_control_row1 = tk.Frame(a_control_frame, bg='#1a1a1a')
-        a_control_row1.pack(expand=True, pady=2)
-        tk.Button(a_control_row1, text="타임아웃 +1 (Q)", command=lambda: self.update_timeout('A', 1),
-                 font=self.font_small, fg='red', width=15).pack(side=tk.LEFT, padx=2)
-        tk.Button(a_control_row1, text="파울 -1 (W)", command=lambda: self.update_foul('A', -1),
-                 font=self.font_small, fg='red', width=15).pack(side=tk.LEFT, padx=2)
-        
-        # 두 번째 줄: 타임아웃 -1, 파울 +1 (파란색)
-        a_control_row2 = tk.Frame(a_control_frame, bg='#1a1a1a')
-        a_control_row2.pack(expand=True, pady=2)
-        tk.Button(a_control_row2, text="타임아웃 -1 (q)", command=lambda: self.update_timeout('A', -1),
-                 font=self.font_small, fg='blue', width=15).pack(side=tk.LEFT, padx=2)
-        tk.Button(a_control_row2, text="파울 +1 (w)", command=lambda: self.update_foul('A', 1),
-                 font=self.font_small, fg='blue', width=15).pack(side=tk.LEFT, padx=2)
-        
-        # B팀 제어
-        b_control_frame = tk.LabelFrame(team_control_frame, text="B팀 제어", 
-                                       font=self.font_small, fg='lightcoral', bg='#1a1a1a')
-        b_control_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
-        
-        # 첫 번째 줄: 타임아웃 +1, 파울 -1 (빨간색)
-        b_control_row1 = tk.Frame(b_control_frame, bg='#1a1a1a')
-        b_control_row1.pack(expand=True, pady=2)
-        tk.Button(b_control_row1, text="타임아웃 +1 (P)", command=lambda: self.update_timeout('B', 1),
-                 font=self.font_small, fg='red', width=15).pack(side=tk.LEFT, padx=2)
-        tk.Button(b_control_row1, text="파울 -1 (O)", command=lambda: self.update_foul('B', -1),
-                 font=self.font_small, fg='red', width=15).pack(side=tk.LEFT, padx=2)
-        
-        # 두 번째 줄: 타임아웃 -1, 파울 +1 (파란색)
-        b_control_row2 = tk.Frame(b_control_frame, bg='#1a1a1a')
-        b_control_row2.pack(expand=True, pady=2)
-        tk.Button(b_control_row2, text="타임아웃 -1 (p)", command=lambda: self.update_timeout('B', -1),
-                 font=self.font_small, fg='blue', width=15).pack(side=tk.LEFT, padx=2)
-        tk.Button(b_control_row2, text="파울 +1 (o)", command=lambda: self.update_foul('B', 1),
-                 font=self.font_small, fg='blue', width=15).pack(side=tk.LEFT, padx=2)
+        for team, side, padx, fg in (('A', tk.LEFT, (0, 5), 'lightblue'), ('B', tk.RIGHT, (5, 0), 'lightcoral')):
+            control_frame = self._titled_frame(team_control_frame, f"{team}팀 제어", fg,
+                                               side=side, fill=tk.BOTH, expand=True, padx=padx)
+            
+            # 첫 번째 줄: 타임아웃 +1, 파울 -1 (빨간색) / 두 번째 줄: 타임아웃 -1, 파울 +1 (파란색)
+            self._make_buttons(control_frame, self._TEAM_CONTROL_ROWS[team], pady=2, width=15)
         
         # 시간/샷클럭 조작 (좌우 배치)
         time_shot_frame = tk.Frame(parent, bg='#1a1a1a')
         time_shot_frame.pack(fill=tk.X, pady=(0, 10))
         
         # 게임 시간 제어 (왼쪽) - A팀과 동일한 패딩
-        game_time_frame = tk.LabelFrame(time_shot_frame, text="게임 시간", 
-                                       font=self.font_small, fg='yellow', bg='#1a1a1a')
-        game_time_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
-        
-        # 게임시간 버튼 컨테이너
-        game_time_buttons = tk.Frame(game_time_frame, bg='#1a1a1a')
-        game_time_buttons.pack(side=tk.LEFT, expand=True)
-        
-        # 첫 번째 줄: -1초, -10초, -1분
-        game_time_row1 = tk.Frame(game_time_buttons, bg='#1a1a1a')
-        game_time_row1.pack(pady=2)
-        tk.Button(game_time_row1, text="-1초 (←)", command=lambda: self.adjust_time(-1),
-                 font=self.font_small, width=7).pack(side=tk.LEFT, padx=2)
-        tk.Button(game_time_row1, text="-10초 (↓)", command=lambda: self.adjust_time(-10),
-                 font=self.font_small, width=7).pack(side=tk.LEFT, padx=2)
-        tk.Button(game_time_row1, text="-1분 (<)", command=lambda: self.adjust_time(-60),
-                 font=self.font_small, width=7).pack(side=tk.LEFT, padx=2)
-        
-        # 두 번째 줄: +1초, +10초, +1분
-        game_time_row2 = tk.Frame(game_time_buttons, bg='#1a1a1a')
-        game_time_row2.pack(pady=2)
-        tk.Button(game_time_row2, text="+1초 (→)", command=lambda: self.adjust_time(1),
-                 font=self.font_small, width=7).pack(side=tk.LEFT, padx=2)
-        tk.Button(game_time_row2, text="+10초 (↑)", command=lambda: self.adjust_time(10),
-                 font=self.font_small, width=7).pack(side=tk.LEFT, padx=2)
-        tk.Button(game_time_row2, text="+1분 (>)", command=lambda: self.adjust_time(60),
-                 font=self.font_small, width=7).pack(side=tk.LEFT, padx=2)
+        game_time_frame = self._titled_frame(time_shot_frame, "게임 시간", 'yellow',
+                                             side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
+        
+        # 게임시간 버튼 (첫 번째 줄: -1초, -10초, -1분 / 두 번째 줄: +1초, +10초, +1분)
+        self._make_buttons(game_time_frame, self._GAME_TIME_ROWS, pady=2, width=7)
         
         # 게임시간 play/pause 버튼 (2줄 높이, 오른쪽)
         self.game_time_button = tk.Button(game_time_frame, text="시간\n▶\n(Space)", 
                                          command=self.toggle_game_time, 
                                          font=self.font_small, fg='red', width=8, height=3)
-        self.game_time_button.pack(side=tk.RIGHT, padx=5, fill=tk.Y)
+        self.game_time_button.grid(row=0, column=3, rowspan=2, padx=5, sticky=tk.NS)
         
         # 샷클럭 제어 (오른쪽) - side를 RIGHT로 명시적으로 설정
-        shot_clock_frame = tk.LabelFrame(time_shot_frame, text="샷클럭 (24초)", 
-                                        font=self.font_small, fg='orange', bg='#1a1a1a')
-        shot_clock_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
-        
-        # 샷클럭 버튼 컨테이너
-        shot_clock_buttons = tk.Frame(shot_clock_frame, bg='#1a1a1a')
-        shot_clock_buttons.pack(side=tk.LEFT, expand=True)
-        
-        # 첫 번째 줄: -1초, -5초, 14초
-        shot_clock_row1 = tk.Frame(shot_clock_buttons, bg='#1a1a1a')
-        shot_clock_row1.pack(pady=2)
-        tk.Button(shot_clock_row1, text="-1초 (z)", command=lambda: self.adjust_shot_time(-1),
-                 font=self.font_small, width=7).pack(side=tk.LEFT, padx=2)
-        tk.Button(shot_clock_row1, text="-5초", command=lambda: self.adjust_shot_time(-5),
-                 font=self.font_small, width=7).pack(side=tk.LEFT, padx=2)
-        tk.Button(shot_clock_row1, text="14초 (f)", command=self.reset_shot_clock_14,
-                 font=self.font_small, width=7).pack(side=tk.LEFT, padx=2)
-        
-        # 두 번째 줄: +1초, +5초, 24초
-        shot_clock_row2 = tk.Frame(shot_clock_buttons, bg='#1a1a1a')
-        shot_clock_row2.pack(pady=2)
-        tk.Button(shot_clock_row2, text="+1초 (a)", command=lambda: self.adjust_shot_time(1),
-                 font=self.font_small, width=7).pack(side=tk.LEFT, padx=2)
-        tk.Button(shot_clock_row2, text="+5초", command=lambda: self.adjust_shot_time(5),
-                 font=self.font_small, width=7).pack(side=tk.LEFT, padx=2)
-        tk.Button(shot_clock_row2, text="24초 (d)", command=self.reset_shot_clock,
-                 font=self.font_small, width=7).pack(side=tk.LEFT, padx=2)
+        shot_clock_frame = self._titled_frame(time_shot_frame, "샷클럭 (24초)", 'orange',
+                                              side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
+        
+        # 샷클럭 버튼 (첫 번째 줄: -1초, -5초, 14초 / 두 번째 줄: +1초, +5초, 24초)
+        self._make_buttons(shot_clock_frame, self._SHOT_CLOCK_ROWS, pady=2, width=7)
         
         # 샷클럭 play/pause 버튼 (2줄 높이, 오른쪽)
         self.shot_clock_button = tk.Button(shot_clock_frame, text="샷클럭\n▶\n(s)", 
                                           command=self.toggle_shot_time, 
                                           font=self.font_small, fg='orange', width=8, height=3)
-        self.shot_clock_button.pack(side=tk.RIGHT, padx=5, fill=tk.Y)
+        self.shot_clock_button.grid(row=0, column=3, rowspan=2, padx=5, sticky=tk.NS)
+        self._has_control = True
         
         # 기타 조작 버튼들 (중앙 배치)
         other_buttons_frame = tk.Frame(parent, bg='#1a1a1a')
         pady_btn = (10, 5) if self.small_screen else (20, 10)
         other_buttons_frame.pack(pady=pady_btn)
         
-        # 버튼 컨테이너 (중앙 정렬용)
-        buttons_container = tk.Frame(other_buttons_frame, bg='#1a1a1a')
-        buttons_container.pack()
-        
         if self.small_screen:
             # 작은 화면: 필수 버튼만 표시 (2줄로 압축)
-            # 첫 번째 줄
-            row1 = tk.Frame(buttons_container, bg='#1a1a1a')
-            row1.pack(pady=1)
-            
-            tk.Button(row1, text="리셋(r)", command=self.reset_all, 
-                     font=self.font_small, width=8).pack(side=tk.LEFT, padx=1)
-            tk.Button(row1, text="시간(t)", command=self.reset_game_time, 
-                     font=self.font_small, fg='blue', width=8).pack(side=tk.LEFT, padx=1)
-            tk.Button(row1, text="Q-([)", command=lambda: self.adjust_period(-1),
-                     font=self.font_small, width=8).pack(side=tk.LEFT, padx=1)
-            tk.Button(row1, text="Q+(])", command=lambda: self.adjust_period(1),
-                     font=self.font_small, width=8).pack(side=tk.LEFT, padx=1)
-            
-            # 두 번째 줄
-            row2 = tk.Frame(buttons_container, bg='#1a1a1a')
-            row2.pack(pady=1)
-            
-            tk.Button(row2, text="설정(F2)", command=self.show_settings, 
-                     font=self.font_small, width=8).pack(side=tk.LEFT, padx=1)
-            tk.Button(row2, text="게임(F3)", command=self.change_game, 
-                     font=self.font_small, fg='orange', width=8).pack(side=tk.LEFT, padx=1)
-            tk.Button(row2, text="모니터(F4)", command=self.toggle_monitor_swap, 
-                     font=self.font_small, fg='purple', width=8).pack(side=tk.LEFT, padx=1)
-            tk.Button(row2, text="종료(Esc)", command=self.on_closing, 
-                     font=self.font_small, fg='red', width=8).pack(side=tk.LEFT, padx=1)
+            self._make_buttons(other_buttons_frame, self._OTHER_ROWS_SMALL, padx=1, pady=1, width=8)
         else:
-            # 일반 화면: 모든 버튼 한 줄로 표시
-            tk.Button(buttons_container, text="전체 리셋 (r)", 
-                     command=self.reset_all, font=self.font_small).pack(side=tk.LEFT, padx=2)
-            
-            # 게임 시간 리셋 (전체 리셋 옆에 배치)
-            tk.Button(buttons_container, text="시간 리셋 (t)", 
-                     command=self.reset_game_time, font=self.font_small, fg='blue').pack(side=tk.LEFT, padx=5)
-            
-            # 쿼터 조작 (시간 리셋 옆에 배치)
-            tk.Button(buttons_container, text="쿼터 -1 ([)", command=lambda: self.adjust_period(-1),
-                     font=self.font_small).pack(side=tk.LEFT, padx=5)
-            tk.Button(buttons_container, text="쿼터 +1 (])", command=lambda: self.adjust_period(1),
-                     font=self.font_small).pack(side=tk.LEFT, padx=5)
-            
-            # 설정 버튼 (쿼터 버튼 옆)
-            tk.Button(buttons_container, text="설정 (F2)", 
-                     command=self.show_settings, font=self.font_small).pack(side=tk.LEFT, padx=5)
-            
-            # 게임 변경 버튼 (설정 버튼 옆)
-            tk.Button(buttons_container, text="게임 변경 (F3)", 
-                     command=self.change_game, font=self.font_small, fg='orange').pack(side=tk.LEFT, padx=5)
-            
-            # 모니터 전환 버튼 (게임 변경 버튼 옆)
-            tk.Button(buttons_container, text="모니터 전환 (F4)", 
-                     command=self.toggle_monitor_swap, font=self.font_small, fg='purple').pack(side=tk.LEFT, padx=5)
-            
-            # 종료 버튼 (모니터 전환 버튼 옆)
-            tk.Button(buttons_container, text="종료 (Esc)", 
-                     command=self.on_closing, font=self.font_small, fg='red').pack(side=tk.LEFT, padx=5)
+            # 일반 화면: 모든 버튼 한 줄로 표시 (전체 리셋, 시간 리셋, 쿼터, 설정, 게임 변경, 모니터 전환, 종료)
+            self._make_buttons(other_buttons_frame, (self._OTHER_BTNS[:1],))
+            self._make_buttons(other_buttons_frame, (self._OTHER_BTNS[1:],), padx=5, column=1)
         
     
     def create_simple_hints(self, parent):
@@ -1120,10 +1444,8 @@ class DualMonitorScoreboard:
         hints_frame = tk.Frame(parent, bg='#1a1a1a')
         hints_frame.pack(fill=tk.X, pady=(6, 0))  # 1.2배 증가 (5->6)
         
-        hints_text = "Space(시작) | t(시간리셋) | s(샷클럭) | d/f(24/14초) | F2(설정)"
-        
-        tk.Label(hints_frame, text=hints_text, 
-                font=('Arial', 8), fg='gray', bg='#1a1a1a').pack(anchor=tk.CENTER)  # 1.2배 증가 (7->8)
+        tk.Label(hints_frame, text=SIMPLE_HINTS_TEXT, 
+                font=self.font_hint, fg='gray', bg='#1a1a1a').pack(anchor=tk.CENTER)  # 1.2배 증가 (7->8)
     
     def create_hints(self, parent):
         """힌트 표시"""
@@ -1131,23 +1453,42 @@ class DualMonitorScoreboard:
                                    font=self.font_small, fg='gray', bg='#1a1a1a')
         hints_frame.pack(fill=tk.X, pady=(10, 0))
         
-        # 초기 크기 (아직 정확하지 않을 수 있음)
+        self._pending_hints = None  # 예약된 힌트 갱신 after ID
+        self._last_hints_size = None  # 마지막으로 표시한 (너비, 높이)
+        
+        # 창 크기 (크기 변경 시 이 라벨만 갱신, 초기 크기는 아직 정확하지 않을 수 있음)
         self.hints_label = tk.Label(hints_frame, text="", 
                               font=self.font_small, fg='gray', bg='#1a1a1a', justify=tk.LEFT)
         self.hints_label.pack(anchor=tk.W)
         
+        # 단축키 목록 (고정 텍스트, 한 번만 배치)
+        tk.Label(hints_frame, text=HINTS_TEXT, 
+                font=self.font_small, fg='gray', bg='#1a1a1a', justify=tk.LEFT).pack(anchor=tk.W)
+        
         # 힌트 텍스트 업데이트 (크기 포함)
         self.update_hints_text()
     
+    def _on_control_configure(self, event):
+        """컨트롤 창 크기 변경 시 힌트 갱신 예약 (50ms 안의 연속 이벤트는 한 번으로 합침)"""
+        if event.widget is not self.control_window:
+            return  # 자식 위젯의 Configure 이벤트는 무시
+        if self._pending_hints:
+            self.control_window.after_cancel(self._pending_hints)
+        self._pending_hints = self.control_window.after(50, self.update_hints_text)
+    
     def update_hints_text(self):
-        """힌트 텍스트 업데이트 (창 크기 포함)"""
+        """힌트의 창 크기 표시 업데이트 (크기가 그대로면 생략)"""
         if not hasattr(self, 'hints_label'):
             return
+        self._pending_hints = None
         
         # 컨트롤 창 크기 가져오기
         try:
             width = self.control_window.winfo_width()
             height = self.control_window.winfo_height()
+            if (width, height) == self._last_hints_size:
+                return
+            self._last_hints_size = (width, height)
             size_text = f"화면 크기: {width} × {height}"
             
             # 윈도우 타이틀도 업데이트
@@ -1156,344 +1497,191 @@ class DualMonitorScoreboard:
         except:
             size_text = "화면 크기: 계산 중..."
         
-        hints_text = f"""{size_text}
-점수: 1/2/3(A팀 +1/+2/+3) | 0/9/8(B팀 +1/+2/+3) | `/-(A/B팀 -1)
-게임시간: 스페이스(play/pause) | t(시간 리셋) | ←→(±1초) | ↑↓(±10초) | <>(±1분)
-샷클럭: s(play/pause) | a/z(±1초) | d(24초 리셋) | f(14초 리셋)
-홈팀(A): q/Q(타임아웃 -/+) | w/W(파울 +/-) | 원정팀(B): p/P(타임아웃 -/+) | o/O(파울 +/-)
-게임: R(전체 리셋) | [](쿼터 ±1) | F2(설정) | F3(게임 변경) | F4(모니터 전환) | Esc(종료 확인)"""
-        
-        self.hints_label.config(text=hints_text)
+        self.hints_label.config(text=size_text)
     
     def create_presentation_window(self):
         """프레젠테이션용 전체화면 창 생성 (모니터 전환 기능 포함)"""
         self.presentation_window = tk.Toplevel(self.root)
         self.presentation_window.title("Basketball Scoreboard - Presentation")
+        self._place_presentation_window()
         
-        # 모니터 전환에 따른 위치 설정
-        if self.cfg.get("swap_monitors", False):
-            # 전환 모드: 프레젠테이션 창을 첫 번째 모니터에
-            self.presentation_window.geometry("1920x1080+0+0")  # 첫 번째 모니터
-        else:
-            # 기본 모드: 프레젠테이션 창을 두 번째 모니터에
-            screen_width = self.root.winfo_screenwidth()
-            self.presentation_window.geometry(f"1920x1080+{screen_width}+0")  # 두 번째 모니터
-        
-        self.presentation_window.configure(bg='#111111')
+        self.presentation_window.configure(bg=self._BG)
         self.presentation_window.attributes('-fullscreen', True)
         self.presentation_window.resizable(False, False)
         
-        # 메인 프레임 (세로 중앙정렬)
-        main_frame = tk.Frame(self.presentation_window, bg='#111111')
-        main_frame.pack(fill=tk.BOTH, expand=True)
+        # 메인 콘텐츠 프레임 (place로 창 중앙에 고정 - 여백용 프레임 없이 세로 중앙정렬)
+        content_frame = tk.Frame(self.presentation_window, bg=self._BG)
+        content_frame.place(relx=0.5, rely=0.5, relwidth=1.0, anchor=tk.CENTER)
         
-        # 세로 중앙정렬을 위한 상하 여백 프레임
-        top_spacer = tk.Frame(main_frame, bg='#111111')
-        top_spacer.pack(fill=tk.BOTH, expand=True)
+        # 프레젠테이션 창 팀 순서 설정 (바뀐 경우 B팀이 왼쪽, A팀이 오른쪽)
+        self.pres_time_frame = None
+        self.create_team_display(content_frame, self.cfg.get("presentation_team_swapped", False))
         
-        # 메인 콘텐츠 프레임 (중앙에 배치)
-        content_frame = tk.Frame(main_frame, bg='#111111')
-        content_frame.pack(fill=tk.X, pady=50)
+        # 중앙 시간 표시
+        self.create_time_display(content_frame)
+        self.presentation_window.bind('<Key>', self.on_key_press)
+        self.presentation_window.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self._pres_built = True
+        self._has_pres = True
+        self._reset_display_cache()
+    
+    def _place_presentation_window(self):
+        """모니터 전환 설정에 따라 프레젠테이션 창 위치 지정 (미리 만든 geometry 문자열 선택)"""
+        self.presentation_window.geometry(self._pres_geometry[bool(self.cfg.get("swap_monitors", False))])
+    
+    def show_presentation_window(self):
+        """프레젠테이션 창 표시 (처음에만 생성하고 이후에는 숨겼던 창을 다시 표시)"""
+        if not self._pres_built:
+            self.create_presentation_window()
+            return
+        if self._has_pres:
+            return
+        self._place_presentation_window()  # 숨겨진 동안 모니터 전환이 바뀌었을 수 있음
+        self.presentation_window.deiconify()
+        self.presentation_window.attributes('-fullscreen', True)
+        self._has_pres = True
+        self._reset_display_cache()
+        self.update_displays()
+    
+    def hide_presentation_window(self):
+        """프레젠테이션 창 숨기기 (파괴하지 않고 withdraw - 다시 켤 때 재생성 비용 없음)"""
+        if self._has_pres:
+            self.presentation_window.withdraw()
+            self._has_pres = False
+    
+    def create_team_display(self, parent, swapped):
+        """팀 표시 영역 생성 (모두 흰색으로 표시, 좌우 순서는 _assign_sides에서 배치)"""
+        self._pres_sides = {team: self._build_team_side(parent, team) for team in ('A', 'B')}
+        self._assign_sides(swapped)
+    
+    def _build_team_side(self, parent, team):
+        """한 팀 영역 (팀 이름, 점수, 타임아웃/파울) 위젯 생성 - 배치는 하지 않음"""
+        v = self._vars
+        frame = tk.Frame(parent, bg=self._BG)
         
-        bottom_spacer = tk.Frame(main_frame, bg='#111111')
-        bottom_spacer.pack(fill=tk.BOTH, expand=True)
+        tk.Label(frame, textvariable=v[f"team{team}"], font=self.pres_font_team, 
+                fg='white', bg=self._BG).pack(pady=(50, 20))
         
-        # 프레젠테이션 창 팀 순서 설정
-        is_swapped = self.cfg.get("presentation_team_swapped", False)
+        tk.Label(frame, textvariable=v[f"score{team}"], font=self.pres_font_score, 
+                fg='white', bg=self._BG).pack(pady=(0, 20))
         
-        if is_swapped:
-            # 팀 순서가 바뀐 경우: B팀이 왼쪽, A팀이 오른쪽
-            self.create_team_display(content_frame, self.teamB_name, self.teamA_name, True)
-        else:
-            # 기본 순서: A팀이 왼쪽, B팀이 오른쪽
-            self.create_team_display(content_frame, self.teamA_name, self.teamB_name, False)
+        # 타임아웃/파울 표시
+        stats_frame = tk.Frame(frame, bg=self._BG)
+        stats_frame.pack(pady=10)
         
-        # 중앙 시간 표시
-        self.create_time_display(content_frame)
+        tk.Label(stats_frame, text="TO", font=self.pres_font_stats, 
+                fg='white', bg=self._BG).pack(side=tk.LEFT, padx=5)
+        tk.Label(stats_frame, textvariable=v[f"timeouts{team}"], font=self.pres_font_stats, 
+                fg='white', bg=self._BG).pack(side=tk.LEFT, padx=10)
+        
+        tk.Label(stats_frame, text="F", font=self.pres_font_stats, 
+                fg='white', bg=self._BG).pack(side=tk.LEFT, padx=5)
+        tk.Label(stats_frame, textvariable=v[f"fouls{team}"], font=self.pres_font_stats, 
+                fg='white', bg=self._BG).pack(side=tk.LEFT)
+        
+        return frame
     
-    def create_team_display(self, parent, left_team, right_team, swapped):
-        """팀 표시 영역 생성 (모두 흰색으로 표시)"""
-        # 왼쪽 팀 (A팀 또는 B팀)
-        left_frame = tk.Frame(parent, bg='#111111')
-        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        left_team_label = tk.Label(left_frame, text=left_team, 
-                                  font=self.pres_font_team, 
-                                  fg='white', bg='#111111')
-        left_team_label.pack(pady=(50, 20))
-        
-        if swapped:
-            self.pres_score_b_label = tk.Label(left_frame, text=str(self.scoreB), 
-                                             font=self.pres_font_score, 
-                                             fg='white', bg='#111111')
-            self.pres_score_b_label.pack(pady=(0, 20))
-            
-            # B팀 타임아웃/파울 표시
-            stats_b_frame = tk.Frame(left_frame, bg='#111111')
-            stats_b_frame.pack(pady=10)
-            
-            tk.Label(stats_b_frame, text="TO", font=self.pres_font_stats, 
-                    fg='white', bg='#111111').pack(side=tk.LEFT, padx=5)
-            self.pres_timeout_b_label = tk.Label(stats_b_frame, text=str(self.timeoutsB), 
-                                               font=self.pres_font_stats, 
-                                               fg='white', bg='#111111')
-            self.pres_timeout_b_label.pack(side=tk.LEFT, padx=10)
-            
-            tk.Label(stats_b_frame, text="F", font=self.pres_font_stats, 
-                    fg='white', bg='#111111').pack(side=tk.LEFT, padx=5)
-            self.pres_foul_b_label = tk.Label(stats_b_frame, text=str(self.foulsB), 
-                                            font=self.pres_font_stats, 
-                                            fg='white', bg='#111111')
-            self.pres_foul_b_label.pack(side=tk.LEFT)
-        else:
-            self.pres_score_a_label = tk.Label(left_frame, text=str(self.scoreA), 
-                                             font=self.pres_font_score, 
-                                             fg='white', bg='#111111')
-            self.pres_score_a_label.pack(pady=(0, 20))
-            
-            # A팀 타임아웃/파울 표시
-            stats_a_frame = tk.Frame(left_frame, bg='#111111')
-            stats_a_frame.pack(pady=10)
-            
-            tk.Label(stats_a_frame, text="TO", font=self.pres_font_stats, 
-                    fg='white', bg='#111111').pack(side=tk.LEFT, padx=5)
-            self.pres_timeout_a_label = tk.Label(stats_a_frame, text=str(self.timeoutsA), 
-                                               font=self.pres_font_stats, 
-                                               fg='white', bg='#111111')
-            self.pres_timeout_a_label.pack(side=tk.LEFT, padx=10)
-            
-            tk.Label(stats_a_frame, text="F", font=self.pres_font_stats, 
-                    fg='white', bg='#111111').pack(side=tk.LEFT, padx=5)
-            self.pres_foul_a_label = tk.Label(stats_a_frame, text=str(self.foulsA), 
-                                            font=self.pres_font_stats, 
-                                            fg='white', bg='#111111')
-            self.pres_foul_a_label.pack(side=tk.LEFT)
-        
-        # 오른쪽 팀 (B팀 또는 A팀)
-        right_frame = tk.Frame(parent, bg='#111111')
-        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
-        
-        right_team_label = tk.Label(right_frame, text=right_team, 
-                                   font=self.pres_font_team, 
-                                   fg='white', bg='#111111')
-        right_team_label.pack(pady=(50, 20))
-        
-        if swapped:
-            self.pres_score_a_label = tk.Label(right_frame, text=str(self.scoreA), 
-                                             font=self.pres_font_score, 
-                                             fg='white', bg='#111111')
-            self.pres_score_a_label.pack(pady=(0, 20))
-            
-            # A팀 타임아웃/파울 표시
-            stats_a_frame = tk.Frame(right_frame, bg='#111111')
-            stats_a_frame.pack(pady=10)
-            
-            tk.Label(stats_a_frame, text="TO", font=self.pres_font_stats, 
-                    fg='white', bg='#111111').pack(side=tk.LEFT, padx=5)
-            self.pres_timeout_a_label = tk.Label(stats_a_frame, text=str(self.timeoutsA), 
-                                               font=self.pres_font_stats, 
-                                               fg='white', bg='#111111')
-            self.pres_timeout_a_label.pack(side=tk.LEFT, padx=10)
-            
-            tk.Label(stats_a_frame, text="F", font=self.pres_font_stats, 
-                    fg='white', bg='#111111').pack(side=tk.LEFT, padx=5)
-            self.pres_foul_a_label = tk.Label(stats_a_frame, text=str(self.foulsA), 
-                                            font=self.pres_font_stats, 
-                                            fg='white', bg='#111111')
-            self.pres_foul_a_label.pack(side=tk.LEFT)
-        else:
-            self.pres_score_b_label = tk.Label(right_frame, text=str(self.scoreB), 
-                                             font=self.pres_font_score, 
-                                             fg='white', bg='#111111')
-            self.pres_score_b_label.pack(pady=(0, 20))
-            
-            # B팀 타임아웃/파울 표시
-            stats_b_frame = tk.Frame(right_frame, bg='#111111')
-            stats_b_frame.pack(pady=10)
-            
-            tk.Label(stats_b_frame, text="TO", font=self.pres_font_stats, 
-                    fg='white', bg='#111111').pack(side=tk.LEFT, padx=5)
-            self.pres_timeout_b_label = tk.Label(stats_b_frame, text=str(self.timeoutsB), 
-                                               font=self.pres_font_stats, 
-                                               fg='white', bg='#111111')
-            self.pres_timeout_b_label.pack(side=tk.LEFT, padx=10)
-            
-            tk.Label(stats_b_frame, text="F", font=self.pres_font_stats, 
-                    fg='white', bg='#111111').pack(side=tk.LEFT, padx=5)
-            self.pres_foul_b_label = tk.Label(stats_b_frame, text=str(self.foulsB), 
-                                            font=self.pres_font_stats, 
-                                            fg='white', bg='#111111')
-            self.pres_foul_b_label.pack(side=tk.LEFT)
+    def _assign_sides(self, swapped):
+        """팀 영역 좌우 배치 (팀 순서 변경 시 위젯을 다시 만들지 않고 재배치만, 표시 값은 공유 StringVar)"""
+        sides = self._pres_sides
+        left, right = ('B', 'A') if swapped else ('A', 'B')
+        
+        # 시간 표시 영역보다 먼저 배치되어야 좌우 공간을 차지함
+        before = {'before': self.pres_time_frame} if self.pres_time_frame else {}
+        for team in (left, right):
+            sides[team].pack_forget()
+        sides[left].pack(side=tk.LEFT, fill=tk.BOTH, expand=True, **before)
+        sides[right].pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, **before)
     
     def create_time_display(self, parent):
         """시간 표시 영역 생성"""
-        time_frame = tk.Frame(parent, bg='#111111')
+        time_frame = tk.Frame(parent, bg=self._BG)
         time_frame.pack(fill=tk.BOTH, expand=True)
+        self.pres_time_frame = time_frame
         
         # 게임 시간 (분:초와 1/5초를 분리하여 표시)
-        time_container = tk.Frame(time_frame, bg='#111111')
+        time_container = tk.Frame(time_frame, bg=self._BG)
         time_container.pack(pady=(100, 20))
         
         # 분:초 부분 (큰 글자)
-        s = max(0, self.game_seconds)
-        m = int(s) // 60
-        r = int(s) % 60
-        self.pres_time_mmss = tk.Label(time_container, text=f"{m:02d}:{r:02d}", 
+        self.pres_time_mmss = tk.Label(time_container, textvariable=self._vars['mmss'], 
                                        font=self.pres_font_time, 
-                                       fg='yellow', bg='#111111')
+                                       fg=self._TIME_NORM, bg=self._BG)
         self.pres_time_mmss.pack(side=tk.LEFT, anchor='s')
         
         # 1/5초 부분 (75% 크기, 아래 라인 맞춤)
-        fifth = int((s - int(s)) * 5) * 2
-        self.pres_time_fifth = tk.Label(time_container, text=f".{fifth:01d}", 
+        self.pres_time_fifth = tk.Label(time_container, textvariable=self._vars['fifth'], 
                                         font=self.pres_font_time_small, 
-                                        fg='yellow', bg='#111111')
+                                        fg=self._TIME_NORM, bg=self._BG)
         self.pres_time_fifth.pack(side=tk.LEFT, anchor='s')
         
         # 쿼터
-        self.pres_period_label = tk.Label(time_frame, text=f'Q{self.period}', 
+        self.pres_period_label = tk.Label(time_frame, textvariable=self._vars['period'], 
                                          font=self.pres_font_period, 
-                                         fg='white', bg='#111111')
+                                         fg='white', bg=self._BG)
         self.pres_period_label.pack(pady=(0, 20))
         
         # 샷 클럭
-        self.pres_shot_label = tk.Label(time_frame, text=str(int(self.shot_seconds)), 
+        self.pres_shot_label = tk.Label(time_frame, textvariable=self._vars['shot'], 
                                        font=self.pres_font_shot, 
-                                       fg='orange', bg='#111111')
+                                       fg=self._SHOT_NORM, bg=self._BG)
         self.pres_shot_label.pack(pady=(0, 50))
     
     def setup_keyboard_bindings(self):
-        """키보드 바인딩 설정"""
-        self.root.bind('<Key>', self.on_key_press)
+        """키보드 바인딩 설정 (숨겨진 루트 창은 키 입력을 받지 않으므로 바인딩하지 않음)"""
         self.control_window.bind('<Key>', self.on_key_press)
         self.control_window.focus_set()
         
         # 창 닫기 이벤트 바인딩
         self.control_window.protocol("WM_DELETE_WINDOW", self.on_closing)
-        
-        if hasattr(self, 'presentation_window'):
-            self.presentation_window.bind('<Key>', self.on_key_press)
-            self.presentation_window.protocol("WM_DELETE_WINDOW", self.on_closing)
     
     def on_key_press(self, event):
-        """키보드 입력 처리"""
-        key = event.keysym
-        
-        if key == '1':
-            self.update_score('A', 1)
-        elif key == '2':
-            self.update_score('A', 2)
-        elif key == '3':
-            self.update_score('A', 3)
-        elif key == '0':
-            self.update_score('B', 1)
-        elif key == '9':
-            self.update_score('B', 2)
-        elif key == '8':
-            self.update_score('B', 3)
-        elif key == 'grave':  # ` 키
-            self.update_score('A', -1)
-        elif key == 'minus':
-            self.update_score('B', -1)
-        elif key == 'space':
-            self.toggle_game_time()
-        elif key == 's':
-            self.toggle_shot_time()  # 샷클럭 play/pause
-        elif key == 'a':
-            self.adjust_shot_time(1)  # 샷클럭 +1초
-        elif key == 'z':
-            self.adjust_shot_time(-1)  # 샷클럭 -1초
-        elif key == 'd':
-            self.reset_shot_clock()  # 24초 리셋
-        elif key == 'f':
-            self.reset_shot_clock_14()  # 14초 리셋
-        elif key == 'r':
-            self.reset_all()
-        elif key == 't':
-            self.reset_game_time()
-        elif key == 'Left':
-            self.adjust_time(-1)
-        elif key == 'Right':
-            self.adjust_time(1)
-        elif key == 'Up':
-            self.adjust_time(10)
-        elif key == 'Down':
-            self.adjust_time(-10)
-        elif key == 'comma':  # < 키
-            self.adjust_time(-60)
-        elif key == 'period':  # > 키
-            self.adjust_time(60)
-        elif key == 'bracketleft':  # [ 키
-            self.adjust_period(-1)
-        elif key == 'bracketright':  # ] 키
-            self.adjust_period(1)
-        # 타임아웃/파울 조작 (홈팀 A, 원정팀 B)
-        elif key == 'q':
-            self.update_timeout('A', -1)  # 홈팀 타임아웃 -1
-        elif key == 'Q':
-            self.update_timeout('A', 1)   # 홈팀 타임아웃 +1
-        elif key == 'w':
-            self.update_foul('A', 1)      # 홈팀 파울 +1
-        elif key == 'W':
-            self.update_foul('A', -1)     # 홈팀 파울 -1
-        elif key == 'p':
-            self.update_timeout('B', -1)  # 원정팀 타임아웃 -1
-        elif key == 'P':
-            self.update_timeout('B', 1)   # 원정팀 타임아웃 +1
-        elif key == 'o':
-            self.update_foul('B', 1)      # 원정팀 파울 +1
-        elif key == 'O':
-            self.update_foul('B', -1)     # 원정팀 파울 -1
-        elif key == 'F2':
-            self.show_settings()
-        elif key == 'F3':
-            self.change_game()
-        elif key == 'F4':
-            self.toggle_monitor_swap()
-        elif key == 'Escape':
-            self.on_closing()
+        """키보드 입력 처리 (키 -> 동작 표에서 한 번에 조회)"""
+        self._key_dispatch.get(event.keysym, _NOOP)()
+    
+    def _bump(self, attr, delta, lo=0, hi=None):
+        """속성 값을 delta만큼 변경하고 [lo, hi] 범위로 제한"""
+        v = getattr(self, attr) + delta
+        if v < lo:
+            v = lo
+        elif hi is not None and v > hi:
+            v = hi
+        setattr(self, attr, v)
+        return v
     
     def update_score(self, team, points):
         """점수 업데이트"""
-        if team == 'A':
-            self.scoreA = max(0, self.scoreA + points)
-        else:
-            self.scoreB = max(0, self.scoreB + points)
+        self._bump('score' + team, points)
         self.update_displays()
-        self.update_supabase_data()
+        self._mark_dirty()
     
     def update_timeout(self, team, change):
         """타임아웃 업데이트"""
-        if team == 'A':
-            self.timeoutsA = max(0, self.timeoutsA + change)
-        else:
-            self.timeoutsB = max(0, self.timeoutsB + change)
+        self._bump('timeouts' + team, change)
         self.update_displays()
-        self.update_supabase_data()
+        self._mark_dirty()
     
     def update_foul(self, team, change):
         """파울 업데이트"""
-        if team == 'A':
-            self.foulsA = max(0, self.foulsA + change)
-        else:
-            self.foulsB = max(0, self.foulsB + change)
+        self._bump('fouls' + team, change)
         self.update_displays()
-        self.update_supabase_data()
+        self._mark_dirty()
     
     def toggle_game_time(self):
         """게임 시간 시작/정지 (시간이 0이면 리셋)"""
         # 게임 시간이 0이면 리셋
-        if self.game_seconds == 0:
+        if self.game_ms == 0:
             self.reset_game_time()
         else:
             self.running_game = not self.running_game
             # 게임 상태 업데이트
             if self.running_game:
+                self._wake_timer()
                 self.game_status = "live"
             else:
                 self.game_status = "paused"
             self.update_displays()
-            self.update_supabase_data()
+            self._mark_dirty()
     
     def reset_game_time(self):
         """게임 시간 리셋"""
@@ -1502,37 +1690,46 @@ class DualMonitorScoreboard:
         self.game_buzzer_played = False
         self.game_status = "paused"
         self.update_displays()
-        self.update_supabase_data()
+        self._mark_dirty()
     
     def toggle_shot_time(self):
         """샷 클럭 시작/정지"""
         self.running_shot = not self.running_shot
+        if self.running_shot:
+            self._wake_timer()
         self.update_displays()
-        self.update_supabase_data()
+        self._mark_dirty()
     
     def adjust_time(self, seconds):
         """시간 조정"""
-        self.game_seconds = max(0, self.game_seconds + seconds)
         # 시간이 0보다 크면 버저 플래그 리셋
-        if self.game_seconds > 0:
+        if self._bump('game_ms', seconds * 1000) > 0:
             self.game_buzzer_played = False
-        self.update_displays()
-        self.update_supabase_data()
+        self._request_render()
+        self._mark_dirty()
     
     def adjust_period(self, delta):
         """쿼터 조정"""
-        self.period = max(1, min(self.cfg.get("period_max", 4), self.period + delta))
+        self._bump('period', delta, 1, self.cfg.get("period_max", 4))
         self.update_displays()
-        self.update_supabase_data()
+        self._mark_dirty()
     
     def adjust_shot_time(self, delta):
         """샷클럭 시간 조정"""
-        self.shot_seconds = max(0, min(99, self.shot_seconds + delta))
         # 샷 클럭이 0보다 크면 버저 플래그 리셋
-        if self.shot_seconds > 0:
+        if self._bump('shot_ms', delta * 1000, 0, 99_000) > 0:
             self.shot_buzzer_played = False
+        self._request_render()
+        self._mark_dirty()
+    
+    def _request_render(self):
+        """화면 갱신을 다음 유휴 시점으로 미룸 (키를 누르고 있어 밀린 입력은 한 번만 갱신)"""
+        if self._render_after is None:
+            self._render_after = self.root.after_idle(self._flush_render)
+    
+    def _flush_render(self):
+        self._render_after = None
         self.update_displays()
-        self.update_supabase_data()
     
     def reset_shot_clock_14(self):
         """샷클럭 14초 리셋"""
@@ -1540,7 +1737,7 @@ class DualMonitorScoreboard:
         self.running_shot = False
         self.shot_buzzer_played = False  # 버저 플래그 리셋
         self.update_displays()
-        self.update_supabase_data()
+        self._mark_dirty()
     
     def reset_shot_clock(self):
         """샷클럭 24초 리셋"""
@@ -1548,7 +1745,7 @@ class DualMonitorScoreboard:
         self.running_shot = False
         self.shot_buzzer_played = False  # 버저 플래그 리셋
         self.update_displays()
-        self.update_supabase_data()
+        self._mark_dirty()
     
     def reset_all(self):
         """전체 리셋"""
@@ -1568,155 +1765,223 @@ class DualMonitorScoreboard:
         self.game_buzzer_played = False
         self.shot_buzzer_played = False
         self.update_displays()
-        self.update_supabase_data()
+        self._mark_dirty()
     
     def start_timer(self):
-        """타이머 시작"""
-        def timer_thread():
-            while self.timer_running:
-                current_time = time.time()
-                dt = current_time - self.last_update
-                self.last_update = current_time
-                
-                # 게임 시간 업데이트
-                if self.running_game and self.game_seconds > 0:
-                    prev_game_seconds = self.game_seconds
-                    self.game_seconds = max(0, self.game_seconds - dt)
-                    
-                    # 게임 시간이 0이 되는 순간 버저 재생
-                    if prev_game_seconds > 0 and self.game_seconds == 0:
-                        if self.buzzer_sound and not self.game_buzzer_played:
-                            try:
-                                self.buzzer_sound.play()
-                                self.game_buzzer_played = True
-                                print("게임 시간 종료 - 버저 재생")
-                            except Exception as e:
-                                print(f"버저 재생 실패: {e}")
-                
-                # 샷 클럭 업데이트
-                if self.running_shot and self.shot_seconds > 0:
-                    prev_shot_seconds = self.shot_seconds
-                    self.shot_seconds = max(0, self.shot_seconds - dt)
-                    
-                    # 샷 클럭이 0이 되는 순간 버저 재생
-                    if prev_shot_seconds > 0 and self.shot_seconds == 0:
-                        if self.buzzer_sound and not self.shot_buzzer_played:
-                            try:
-                                self.buzzer_sound.play()
-                                self.shot_buzzer_played = True
-                                print("샷 클럭 종료 - 버저 재생")
-                            except Exception as e:
-                                print(f"버저 재생 실패: {e}")
-                
-                # UI 업데이트 (메인 스레드에서)
-                self.root.after(0, self.update_displays)
-                
-                # 1초마다 Supabase 업데이트
-                if current_time - self.supabase_update_timer >= self.supabase_update_interval:
-                    self.supabase_update_timer = current_time
-                    self.root.after(0, self.update_supabase_data)
-                
-                time.sleep(1/60)  # 60 FPS
+        """타이머 시작 (Tk after 스케줄러로 메인 스레드에서 주기 실행)"""
+        self._last_tick_ns = time.monotonic_ns()
+        self._last_sent_secs = None
+        self._tick()
+    
+    def stop_timer(self):
+        """예약된 다음 프레임 취소 (창을 닫기 전에 호출)"""
+        if self._tick_after is not None:
+            self.root.after_cancel(self._tick_after)
+            self._tick_after = None
+    
+    def _wake_timer(self):
+        """느린 주기로 쉬던 타이머를 시계 시작 즉시 빠른 주기로 전환 (쉬던 시간은 시계에서 빼지 않음)"""
+        if self._tick_idle:
+            self.stop_timer()
+            self._tick_idle = False
+            self._last_tick_ns = time.monotonic_ns()
+            self._tick_after = self.root.after(self._TICK_MS, self._tick)
+    
+    def _tick(self):
+        """타이머 한 프레임: 시계 감소, 화면 갱신, 정수 초가 바뀌었을 때만 Supabase 동기화"""
+        now_ns = time.monotonic_ns()
+        dt_ms, rem_ns = divmod(now_ns - self._last_tick_ns, 1_000_000)
+        self._last_tick_ns = now_ns - rem_ns  # 1ms 미만 나머지는 다음 프레임으로 이월
+        
+        # 게임 시간 업데이트 (정수 밀리초 - 긴 경기에서도 누적 오차 없음)
+        if self.running_game and self.game_ms > 0:
+            v = self.game_ms - dt_ms
+            self.game_ms = v if v > 0 else 0
+            
+            # 게임 시간이 0이 되는 순간 버저 재생 (재생 버튼도 리셋 버튼으로 바뀌어야 함)
+            if self.game_ms == 0:
+                self._ui_dirty = True
+                if not self.game_buzzer_played:
+                    self.game_buzzer_played = True
+                    self.buzzer.play()
+                    print("게임 시간 종료 - 버저 재생")
+        
+        # 샷 클럭 업데이트
+        if self.running_shot and self.shot_ms > 0:
+            v = self.shot_ms - dt_ms
+            self.shot_ms = v if v > 0 else 0
+            
+            # 샷 클럭이 0이 되는 순간 버저 재생
+            if self.shot_ms == 0:
+                if not self.shot_buzzer_played:
+                    self.shot_buzzer_played = True
+                    self.buzzer.play()
+                    print("샷 클럭 종료 - 버저 재생")
+        
+        # 시계가 멈춰 있고 바뀐 것이 없으면 화면 갱신 생략 (조작은 각 메서드에서 update_displays 호출)
+        if self._ui_dirty:
+            self.update_displays()
+        elif self.running_game or self.running_shot or self._pending_fifth is not None:
+            self._update_fast()
+        
+        # 표시되는 정수 초가 바뀌었거나, 조작 변경사항이 최소 간격 이상 쌓였을 때만 Supabase 업데이트
+        secs = (self.game_ms // 1000, self.shot_ms // 1000)
+        now = time.monotonic()
+        if secs != self._last_sent_secs or (
+                self._supabase_dirty and now - self._last_sync_t >= self._SYNC_MIN_INTERVAL):
+            self._last_sent_secs = secs
+            self._last_sync_t = now
+            self.update_supabase_data()
         
-        timer = threading.Thread(target=timer_thread, daemon=True)
-        timer.start()
+        # 시계가 멈춰 있으면 느린 주기로 예약 (시작 시 _wake_timer가 다시 빠른 주기로 전환)
+        self._tick_idle = not (self.running_game or self.running_shot)
+        delay = self._IDLE_TICK_MS if self._tick_idle else self._TICK_MS
+        self._tick_after = self.root.after(delay, self._tick)
+    
+    def _create_display_vars(self):
+        """두 창이 함께 쓰는 표시용 StringVar (값을 한 번 set하면 양쪽 라벨이 같이 바뀜)"""
+        self._vars = {key: tk.StringVar(self.root) for key in (
+            'teamA', 'teamB', 'scoreA', 'scoreB', 'timeoutsA', 'timeoutsB', 'foulsA', 'foulsB',
+            'time', 'mmss', 'fifth', 'period', 'shot')}
+        self._reset_display_cache()
+        self.update_displays()
+    
+    def _reset_display_cache(self):
+        """마지막 표시 값 캐시 초기화 (다음 update_displays에서 전부 다시 설정)"""
+        self._last_names = None
+        self._last_scores = None
+        self._last_stats = None
+        self._last_period = None
+        self._last_fifths = -1  # 마지막으로 표시한 게임 시간 (1/5초 단위 정수)
+        self._last_secs_shown = -1  # 마지막으로 표시한 분:초 (초 단위 정수)
+        self._pending_fifth = None  # 최소 간격 때문에 아직 표시하지 못한 1/5초 문자열
+        self._last_fifth_t = 0.0
+        self._last_shot_int = -1
+        self._last_time_warn = None  # 마지막으로 적용한 경고 색상 여부 (게임 시간, 샷 클럭)
+        self._last_shot_warn = None
+        self._last = {}  # _set으로 마지막에 설정한 위젯 옵션 (키별)
+        self._ui_dirty = True  # 다음 프레임에 _update_slow도 실행
+    
+    def _set(self, widget, key, **opts):
+        """위젯 옵션이 마지막으로 설정한 값과 다를 때만 config 호출 (같으면 Tcl 호출 생략)"""
+        if self._last.get(key) != opts:
+            self._last[key] = opts
+            widget.config(**opts)
+    
+    def period_text(self):
+        """현재 쿼터 표시 문자열"""
+        return self._PERIOD_TEXT.get(self.period) or f"Q{self.period}"
     
     def update_displays(self):
-        """화면 업데이트"""
-        # 조작용 창 업데이트
-        self.score_a_label.config(text=str(self.scoreA))
-        self.score_b_label.config(text=str(self.scoreB))
-        self.time_label.config(text=fmt_mmss_centi(self.game_seconds))
-        self.period_label.config(text=f"Q{self.period}")
-        self.shot_label.config(text=str(int(self.shot_seconds)))
-        
-        # 팀 이름 업데이트
-        if hasattr(self, 'team_a_label'):
-            self.team_a_label.config(text=self.teamA_name)
-        if hasattr(self, 'team_b_label'):
-            self.team_b_label.config(text=self.teamB_name)
-        
-        # 타임아웃과 파울 업데이트
-        if hasattr(self, 'timeout_a_label'):
-            self.timeout_a_label.config(text=str(self.timeoutsA))
-            self.timeout_b_label.config(text=str(self.timeoutsB))
-            self.foul_a_label.config(text=str(self.foulsA))
-            self.foul_b_label.config(text=str(self.foulsB))
+        """화면 전체 업데이트 (조작 직후 호출, 타이머는 _update_fast만 매 프레임 호출)"""
+        self._update_slow()
+        self._update_fast()
+    
+    def _update_slow(self):
+        """사람 조작으로만 바뀌는 표시 (팀 이름, 점수, 타임아웃/파울, 쿼터, 재생 버튼)"""
+        self._ui_dirty = False
+        v = self._vars
+        
+        # 팀 이름, 점수, 타임아웃/파울, 쿼터
+        names = (self.teamA_name, self.teamB_name)
+        if names != self._last_names:
+            self._last_names = names
+            v['teamA'].set(self.teamA_name)
+            v['teamB'].set(self.teamB_name)
+        scores = (self.scoreA, self.scoreB)
+        if scores != self._last_scores:
+            self._last_scores = scores
+            v['scoreA'].set(_int_str(self.scoreA))
+            v['scoreB'].set(_int_str(self.scoreB))
+        stats = (self.timeoutsA, self.timeoutsB, self.foulsA, self.foulsB)
+        if stats != self._last_stats:
+            self._last_stats = stats
+            v['timeoutsA'].set(_int_str(self.timeoutsA))
+            v['timeoutsB'].set(_int_str(self.timeoutsB))
+            v['foulsA'].set(_int_str(self.foulsA))
+            v['foulsB'].set(_int_str(self.foulsB))
+        if self.period != self._last_period:
+            self._last_period = self.period
+            v['period'].set(self.period_text())
+        
+        if not self._has_control:
+            return
         
         # 게임시간 버튼 상태 업데이트
-        if hasattr(self, 'game_time_button'):
-            if self.game_seconds == 0:
-                # 게임 시간이 0이면 리셋 버튼으로 변경
-                self.game_time_button.config(text="시간\n리셋\n(Space)", fg='blue')
-            elif self.running_game:
-                self.game_time_button.config(text="시간\n⏸\n(Space)", fg='darkred')
-            else:
-                self.game_time_button.config(text="시간\n▶\n(Space)", fg='red')
+        if self.game_ms == 0:
+            # 게임 시간이 0이면 리셋 버튼으로 변경
+            self._set(self.game_time_button, 'game_btn', text="시간\n리셋\n(Space)", fg='blue')
+        elif self.running_game:
+            self._set(self.game_time_button, 'game_btn', text="시간\n⏸\n(Space)", fg='darkred')
+        else:
+            self._set(self.game_time_button, 'game_btn', text="시간\n▶\n(Space)", fg='red')
         
         # 샷클럭 버튼 상태 업데이트
-        if hasattr(self, 'shot_clock_button'):
-            if self.running_shot:
-                self.shot_clock_button.config(text="샷클럭\n⏸\n(s)", fg='darkorange')
-            else:
-                self.shot_clock_button.config(text="샷클럭\n▶\n(s)", fg='orange')
-        
-        # 프레젠테이션 창 업데이트
-        if hasattr(self, 'presentation_window'):
-            # 프레젠테이션 창 팀 순서에 따라 점수 표시
-            is_swapped = self.cfg.get("presentation_team_swapped", False)
-            if is_swapped:
-                self.pres_score_b_label.config(text=str(self.scoreB))
-                self.pres_score_a_label.config(text=str(self.scoreA))
-            else:
-                self.pres_score_a_label.config(text=str(self.scoreA))
-                self.pres_score_b_label.config(text=str(self.scoreB))
-            
-            # 프레젠테이션 창 타임아웃/파울 업데이트
-            if hasattr(self, 'pres_timeout_a_label'):
-                self.pres_timeout_a_label.config(text=str(self.timeoutsA))
-                self.pres_timeout_b_label.config(text=str(self.timeoutsB))
-                self.pres_foul_a_label.config(text=str(self.foulsA))
-                self.pres_foul_b_label.config(text=str(self.foulsB))
-            
-            # 시간 업데이트 (분:초와 1/5초 분리)
-            s = max(0, self.game_seconds)
-            m = int(s) // 60
-            r = int(s) % 60
-            fifth = int((s - int(s)) * 5) * 2
-            self.pres_time_mmss.config(text=f"{m:02d}:{r:02d}")
-            self.pres_time_fifth.config(text=f".{fifth:01d}")
-            
-            self.pres_period_label.config(text=f"Q{self.period}")
-            self.pres_shot_label.config(text=str(int(self.shot_seconds)))
-            
-            # 마지막 10초부터 빨간색
-            if self.game_seconds <= 10:
-                self.pres_time_mmss.config(fg='red')
-                self.pres_time_fifth.config(fg='red')
-            else:
-                self.pres_time_mmss.config(fg='yellow')
-                self.pres_time_fifth.config(fg='yellow')
+        if self.running_shot:
+            self._set(self.shot_clock_button, 'shot_btn', text="샷클럭\n⏸\n(s)", fg='darkorange')
+        else:
+            self._set(self.shot_clock_button, 'shot_btn', text="샷클럭\n▶\n(s)", fg='orange')
+    
+    def _update_fast(self):
+        """매 프레임 바뀔 수 있는 표시 (게임 시간, 1/5초, 샷 클럭, 경고 색상)"""
+        v = self._vars
+        
+        # 게임 시간 (정수 비교만 하고 1/5초 단위가 바뀐 프레임에만 문자열 조회)
+        # 조작용 창은 전체, 프레젠테이션 창은 분:초(초가 바뀔 때만)와 1/5초 분리
+        fifths = self.game_ms // 200
+        if fifths != self._last_fifths:
+            self._last_fifths = fifths
+            time_str = _fmt_fifth_cached(fifths)
+            v['time'].set(time_str)
+            secs = fifths // 5
+            if secs != self._last_secs_shown:
+                self._last_secs_shown = secs
+                v['mmss'].set(time_str[:-2])
+            self._pending_fifth = time_str[-2:]
+        
+        # 1/5초는 최소 간격을 두고 갱신 (건너뛴 값은 다음 프레임에 다시 시도)
+        if self._pending_fifth is not None:
+            now = time.monotonic()
+            if now - self._last_fifth_t >= self._fifth_min_interval:
+                self._last_fifth_t = now
+                v['fifth'].set(self._pending_fifth)
+                self._pending_fifth = None
+        
+        # 샷 클럭
+        shot_int = self.shot_ms // 1000
+        if shot_int != self._last_shot_int:
+            self._last_shot_int = shot_int
+            v['shot'].set(_int_str(shot_int))
+        
+        # 프레젠테이션 창 색상 (텍스트는 공유 StringVar로 이미 반영됨)
+        if self._has_pres:
+            # 마지막 10초부터 빨간색 (경고 구간에 들어가거나 벗어날 때만 색상 변경)
+            time_warn = self.game_ms <= 10000
+            if time_warn is not self._last_time_warn:
+                self._last_time_warn = time_warn
+                time_fg = self._TIME_FG[time_warn]
+                self.pres_time_mmss.config(fg=time_fg)
+                self.pres_time_fifth.config(fg=time_fg)
             
             # 마지막 5초부터 샷클럭 빨간색
-            if self.shot_seconds <= 5:
-                self.pres_shot_label.config(fg='red')
-            else:
-                self.pres_shot_label.config(fg='orange')
+            shot_warn = self.shot_ms <= 5000
+            if shot_warn is not self._last_shot_warn:
+                self._last_shot_warn = shot_warn
+                self.pres_shot_label.config(fg=self._SHOT_FG[shot_warn])
     
     def toggle_monitor_swap(self):
         """모니터 전환 토글"""
         self.cfg["swap_monitors"] = not self.cfg.get("swap_monitors", False)
-        save_cfg(self.cfg)
+        self.request_save_cfg()
         
-        # 프레젠테이션 창 재생성
-        if hasattr(self, 'presentation_window') and self.cfg.get("dual_monitor", False):
-            self.presentation_window.destroy()
-            self.create_presentation_window()
+        # 프레젠테이션 창은 다시 만들지 않고 위치만 이동 (전체화면은 잠시 풀었다가 다시 적용)
+        if self._has_pres:
+            self.presentation_window.attributes('-fullscreen', False)
+            self._place_presentation_window()
+            self.presentation_window.attributes('-fullscreen', True)
         
-        # 컨트롤 창도 재생성 (위치 변경)
-        self.control_window.destroy()
-        self.create_control_window()
-        self.setup_keyboard_bindings()
+        # 컨트롤 창도 다시 만들지 않고 위치만 이동 (크기와 위젯은 그대로)
+        self.control_window.geometry(self._control_window_offset())
     
     def change_game(self):
         """게임 변경 (게임 선택 화면으로 이동)"""
@@ -1726,12 +1991,14 @@ class DualMonitorScoreboard:
         
         if result == 'yes':
             # 현재 앱 종료
-            self.timer_running = False
-            save_cfg(self.cfg)
+            self.stop_timer()
+            self._stop_sync_worker()
+            self.flush_save_cfg()
             
             # 모든 창 닫기
-            if hasattr(self, 'presentation_window'):
+            if self._pres_built:
                 self.presentation_window.destroy()
+                self._pres_built = self._has_pres = False
             self.control_window.destroy()
             self.root.destroy()
             
@@ -1748,14 +2015,124 @@ class DualMonitorScoreboard:
                                          icon='question')
         
         if result == 'yes':
-            self.timer_running = False
-            save_cfg(self.cfg)
+            self.stop_timer()
+            self._stop_sync_worker()
+            close_supabase_client()  # 전송 워커가 끝난 뒤 HTTP 연결 정리
+            self.flush_save_cfg()
             self.root.quit()
             self.root.destroy()
     
+    def _radio_row(self, parent, var, values, label_fmt, padx=3, **pack_opts):
+        """값 목록으로 라디오 버튼 한 줄 생성 (label_fmt는 표시 문자열 형식, 튜플 값은 (값, 표시 이름))"""
+        row = tk.Frame(parent)
+        row.pack(**pack_opts)
+        for value in values:
+            value, label = value if isinstance(value, tuple) else (value, label_fmt.format(value))
+            tk.Radiobutton(row, text=label, variable=var, value=value).pack(side=tk.LEFT, padx=padx)
+    
+    def _build_team_settings(self, parent, settings_window, team, side, padx, fg):
+        """설정 창의 한 팀 영역 생성 -> (이름 Entry, 컬러 변수, 로고 변수), 서버 게임이면 모두 None"""
+        num = '1' if team == 'A' else '2'
+        color_key = f"team_{team.lower()}_color"
+        default_color = "#F4F4F4" if team == 'A' else "#2563EB"
+        name = getattr(self, f"team{team}_name")
+        
+        team_frame = tk.LabelFrame(parent, text=f"{team}팀 설정", 
+                                   font=self.font_small, fg=fg)
+        team_frame.pack(side=side, fill=tk.BOTH, expand=True, padx=padx)
+        
+        tk.Label(team_frame, text="팀 이름:").pack(pady=(10, 5))
+        
+        if not self.is_quick_start:
+            # 서버 게임: 이름과 컬러 모두 읽기 전용 Label
+            tk.Label(team_frame, text=name, fg=fg,
+                    font=self.font_small).pack(pady=5)
+            tk.Label(team_frame, text="팀 컬러:").pack(pady=(10, 5))
+            team_color = getattr(self, f"team{num}_color", None) or self.cfg.get(color_key, default_color)
+            # 팔레트에 있으면 이름, 없으면 hex 코드 표시
+            tk.Label(team_frame, text=_COLOR_NAME_BY_HEX.get(team_color, team_color), fg=fg,
+                    font=self.font_small).pack(pady=5)
+            return None, None, None
+        
+        # 바로 시작: 수정 가능한 Entry
+        entry = tk.Entry(team_frame)
+        entry.pack(pady=5, padx=10)
+        entry.insert(0, name)
+        
+        # 팀 컬러: 라디오 버튼 3개씩 2줄
+        tk.Label(team_frame, text="팀 컬러:").pack(pady=(10, 5))
+        color_var = tk.StringVar(value=self.cfg.get(color_key, default_color))
+        self._radio_row(team_frame, color_var, _TEAM_COLORS[:3], None, padx=5, pady=2)
+        self._radio_row(team_frame, color_var, _TEAM_COLORS[3:], None, padx=5, pady=2)
+        
+        # 팀 로고 설정
+        tk.Label(team_frame, text="팀 로고:").pack(pady=(10, 5))
+        logo_var = tk.StringVar(value=getattr(self, f"team{num}_logo", None) or "")
+        
+        logo_display_frame = tk.Frame(team_frame)
+        logo_display_frame.pack(pady=5)
+        
+        logo_label = tk.Label(logo_display_frame, 
+                              text="로고 없음" if not logo_var.get() else "로고 설정됨",
+                              fg='yellow')
+        logo_label.pack(side=tk.LEFT, padx=5)
+        
+        # 로고 값이 바뀌면 (선택 또는 설정 창 다시 열기) 라벨 업데이트
+        def update_logo_label(*args):
+            logo_label.config(text="로고 없음" if not logo_var.get() else "로고 설정됨")
+        
+        logo_var.trace_add('write', update_logo_label)
+        
+        def select_logo():
+            result = show_logo_selection_dialog(settings_window)
+            
+            # None이면 취소 (아무 것도 하지 않음)
+            if result is None:
+                return
+            
+            # 선택됨 (빈 문자열 = 로고 없음, URL = 로고 있음, 실제 저장은 save_settings에서)
+            logo_var.set(result)
+            print(f"{team}팀 로고 선택: {result if result else '(로고 없음)'}")
+        
+        tk.Button(logo_display_frame, text="로고 선택", command=select_logo,
+                 font=self.font_note, bg='#2196F3', fg='black').pack(side=tk.LEFT, padx=5)
+        return entry, color_var, logo_var
+    
+    def _open_settings_window(self):
+        """설정 창을 조작용 창 위에 모달로 표시 (조작용 창은 재생성될 수 있으므로 매번 transient 지정)"""
+        window = self._settings_window
+        window.transient(self.control_window)
+        window.deiconify()
+        window.lift()
+        window.grab_set()
+    
+    def _unbind_settings_wheel(self, event=None):
+        """설정 창의 전역 마우스 휠 바인딩 해제 (자식 위젯 경계를 지나는 Leave는 무시)"""
+        if event is not None and event.widget is not self._settings_window:
+            return
+        for sequence in self._WHEEL_EVENTS:
+            self._settings_window.unbind_all(sequence)
+    
+    def _close_settings_window(self):
+        """설정 창 숨기기 (파괴하지 않고 다음에 다시 사용)"""
+        self._unbind_settings_wheel()
+        self._settings_window.grab_release()
+        self._settings_window.withdraw()
+    
     def show_settings(self):
-        """설정 창 표시 (개선된 레이아웃)"""
-        settings_window = tk.Toplevel(self.root)
+        """설정 창 표시 (개선된 레이아웃, 두 번째부터는 만들어 둔 창에 현재 값만 다시 채움)"""
+        if self._settings_window is not None:
+            self._settings_refresh()
+            self._open_settings_window()
+            return
+        
+        # 설정 창 공통 색상/폰트는 옵션 DB로 한 번에 지정 (위젯마다 fg/bg/font 인자를 넘기지 않음)
+        for pattern, value in self._SETTINGS_OPTIONS:
+            self.root.option_add(pattern, value)
+        self.root.option_add("*settings*Entry.font", str(self.font_small))
+        self.root.option_add("*settings*Button.font", str(self.font_small))
+        
+        settings_window = tk.Toplevel(self.root, name="settings")
         settings_window.title("게임 설정")
         
         # small_screen 모드일 때 높이 조정
@@ -1766,15 +2143,12 @@ class DualMonitorScoreboard:
         
         settings_window.configure(bg='#2a2a2a')
         settings_window.resizable(True, True)
-        
-        # 설정 창을 조작용 창 위에 표시
-        settings_window.transient(self.control_window)
-        settings_window.grab_set()
+        settings_window.protocol("WM_DELETE_WINDOW", self._close_settings_window)
         
         # 스크롤 가능한 프레임 생성
         canvas = tk.Canvas(settings_window, bg='#2a2a2a', highlightthickness=0)
         scrollbar = tk.Scrollbar(settings_window, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg='#2a2a2a')
+        scrollable_frame = tk.Frame(canvas)
         
         scrollable_frame.bind(
             "<Configure>",
@@ -1790,417 +2164,294 @@ class DualMonitorScoreboard:
         
         # ===== 방송 채널 설정 =====
         game_id_frame = tk.LabelFrame(scrollable_frame, text="방송 채널 (Supabase 전송용)", 
-                                      font=self.font_small, fg='orange', bg='#2a2a2a')
+                                      font=self.font_small, fg='orange')
         game_id_frame.pack(fill=tk.X, padx=20, pady=10)
         
         # 현재 방송 채널 전체 주소 표시
-        broadcast_channel = self.get_broadcast_channel()
-        tk.Label(game_id_frame, text=f"방송 채널: {broadcast_channel}", 
-                fg='lightgreen', bg='#2a2a2a', font=self.font_small).pack(pady=(10, 5), padx=10, anchor=tk.W)
+        channel_label = tk.Label(game_id_frame, fg='lightgreen', font=self.font_small)
+        channel_label.pack(pady=(10, 5), padx=10, anchor=tk.W)
         
-        tk.Label(game_id_frame, text="채널 ID:", fg='white', bg='#2a2a2a').pack(pady=(10, 5), padx=10, anchor=tk.W)
-        game_id_entry = tk.Entry(game_id_frame, font=self.font_small, width=40)
+        tk.Label(game_id_frame, text="채널 ID:").pack(pady=(10, 5), padx=10, anchor=tk.W)
+        game_id_entry = tk.Entry(game_id_frame, width=40)
         game_id_entry.pack(pady=5, padx=10, anchor=tk.W)
-        game_id_entry.insert(0, self.game_id)
         
         tk.Label(game_id_frame, text="※ 여러 기기에서 같은 게임을 공유하려면 동일한 채널 ID를 사용하세요.", 
-                fg='gray', bg='#2a2a2a', font=('Arial', 9)).pack(pady=(0, 10), padx=10, anchor=tk.W)
+                fg='gray', font=self.font_note).pack(pady=(0, 10), padx=10, anchor=tk.W)
         
         # 구분선
-        tk.Label(scrollable_frame, text="─────────────────────────────────────", fg='gray', bg='#2a2a2a').pack(pady=10)
+        tk.Label(scrollable_frame, text="─────────────────────────────────────", fg='gray').pack(pady=10)
         
         # ===== 팀 설정 (좌우 배치) =====
-        teams_frame = tk.Frame(scrollable_frame, bg='#2a2a2a')
+        teams_frame = tk.Frame(scrollable_frame)
         teams_frame.pack(fill=tk.X, padx=20, pady=10)
         
-        # A팀 설정 (왼쪽)
-        team_a_frame = tk.LabelFrame(teams_frame, text="A팀 설정", 
-                                     font=self.font_small, fg='lightblue', bg='#2a2a2a')
-        team_a_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
-        
-        tk.Label(team_a_frame, text="팀 이름:", fg='white', bg='#2a2a2a').pack(pady=(10, 5))
-        
-        team_a_entry = None
-        if self.is_quick_start:
-            # 바로 시작: 수정 가능한 Entry
-            team_a_entry = tk.Entry(team_a_frame, font=self.font_small)
-            team_a_entry.pack(pady=5, padx=10)
-            team_a_entry.insert(0, self.teamA_name)
-        else:
-            # 서버 게임: 읽기 전용 Label
-            tk.Label(team_a_frame, text=self.teamA_name, fg='lightblue', bg='#2a2a2a',
-                    font=self.font_small).pack(pady=5)
-        
-        # A팀 컬러 및 로고
-        team_a_color_var = None
-        team_a_logo_var = None
-        colors = ["#F4F4F4", "#2563EB", "#EF4444", "#FACC15", "#222222", "#22C55E"]
-        color_names = ["흰색", "파랑", "빨강", "노랑", "검정", "녹색"]
-        color_map = dict(zip(colors, color_names))
-        
-        if self.is_quick_start:
-            # 바로 시작: 라디오 버튼으로 선택 가능
-            tk.Label(team_a_frame, text="팀 컬러:", fg='white', bg='#2a2a2a').pack(pady=(10, 5))
-            team_a_color_var = tk.StringVar(value=self.cfg.get("team_a_color", "#F4F4F4"))
-            
-            # 3개씩 2줄로 표시
-            color_row1 = tk.Frame(team_a_frame, bg='#2a2a2a')
-            color_row1.pack(padx=10, pady=2)
-            for i in range(3):
-                tk.Radiobutton(color_row1, text=color_names[i], variable=team_a_color_var, 
-                              value=colors[i], fg='white', bg='#2a2a2a', selectcolor='#444444').pack(side=tk.LEFT, padx=5)
-            
-            color_row2 = tk.Frame(team_a_frame, bg='#2a2a2a')
-            color_row2.pack(padx=10, pady=2)
-            for i in range(3, 6):
-                tk.Radiobutton(color_row2, text=color_names[i], variable=team_a_color_var, 
-                              value=colors[i], fg='white', bg='#2a2a2a', selectcolor='#444444').pack(side=tk.LEFT, padx=5)
-            
-            # A팀 로고 설정
-            tk.Label(team_a_frame, text="팀 로고:", fg='white', bg='#2a2a2a').pack(pady=(10, 5))
-            team_a_logo_var = tk.StringVar(value=getattr(self, 'team1_logo', None) or "")
-            
-            logo_display_frame = tk.Frame(team_a_frame, bg='#2a2a2a')
-            logo_display_frame.pack(pady=5)
-            
-            team_a_logo_label = tk.Label(logo_display_frame, 
-                                         text="로고 없음" if not team_a_logo_var.get() else "로고 설정됨",
-                                         fg='yellow', bg='#2a2a2a')
-            team_a_logo_label.pack(side=tk.LEFT, padx=5)
-            
-            def select_team_a_logo():
-                result = show_logo_selection_dialog(settings_window)
-                
-                # None이면 취소 (아무 것도 하지 않음)
-                if result is None:
-                    return
-                
-                # 선택됨 (빈 문자열 = 로고 없음, URL = 로고 있음)
-                team_a_logo_var.set(result)
-                
-                # UI 업데이트만 (실제 저장은 save_settings에서)
-                team_a_logo_label.config(text="로고 없음" if not result else "로고 설정됨")
-                print(f"A팀 로고 선택: {result if result else '(로고 없음)'}")
-            
-            tk.Button(logo_display_frame, text="로고 선택", command=select_team_a_logo,
-                     font=('Arial', 9), bg='#2196F3', fg='black').pack(side=tk.LEFT, padx=5)
-        else:
-            # 서버 게임: 읽기 전용으로 컬러 표시
-            tk.Label(team_a_frame, text="팀 컬러:", fg='white', bg='#2a2a2a').pack(pady=(10, 5))
-            team_a_color = getattr(self, 'team1_color', None) or self.cfg.get("team_a_color", "#F4F4F4")
-            # 팔레트에 있으면 이름, 없으면 hex 코드 표시
-            color_display = color_map.get(team_a_color, team_a_color)
-            tk.Label(team_a_frame, text=color_display, fg='lightblue', bg='#2a2a2a',
-                    font=self.font_small).pack(pady=5)
-        
-        # B팀 설정 (오른쪽)
-        team_b_frame = tk.LabelFrame(teams_frame, text="B팀 설정", 
-                                     font=self.font_small, fg='lightcoral', bg='#2a2a2a')
-        team_b_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(10, 0))
-        
-        tk.Label(team_b_frame, text="팀 이름:", fg='white', bg='#2a2a2a').pack(pady=(10, 5))
-        
-        team_b_entry = None
-        if self.is_quick_start:
-            # 바로 시작: 수정 가능한 Entry
-            team_b_entry = tk.Entry(team_b_frame, font=self.font_small)
-            team_b_entry.pack(pady=5, padx=10)
-            team_b_entry.insert(0, self.teamB_name)
-        else:
-            # 서버 게임: 읽기 전용 Label
-            tk.Label(team_b_frame, text=self.teamB_name, fg='lightcoral', bg='#2a2a2a',
-                    font=self.font_small).pack(pady=5)
-        
-        # B팀 컬러 및 로고
-        team_b_color_var = None
-        team_b_logo_var = None
-        if self.is_quick_start:
-            # 바로 시작: 라디오 버튼으로 선택 가능
-            tk.Label(team_b_frame, text="팀 컬러:", fg='white', bg='#2a2a2a').pack(pady=(10, 5))
-            team_b_color_var = tk.StringVar(value=self.cfg.get("team_b_color", "#2563EB"))
-            
-            # 3개씩 2줄로 표시
-            color_row1 = tk.Frame(team_b_frame, bg='#2a2a2a')
-            color_row1.pack(padx=10, pady=2)
-            for i in range(3):
-                tk.Radiobutton(color_row1, text=color_names[i], variable=team_b_color_var, 
-                              value=colors[i], fg='white', bg='#2a2a2a', selectcolor='#444444').pack(side=tk.LEFT, padx=5)
-            
-            color_row2 = tk.Frame(team_b_frame, bg='#2a2a2a')
-            color_row2.pack(padx=10, pady=2)
-            for i in range(3, 6):
-                tk.Radiobutton(color_row2, text=color_names[i], variable=team_b_color_var, 
-                              value=colors[i], fg='white', bg='#2a2a2a', selectcolor='#444444').pack(side=tk.LEFT, padx=5)
-            
-            # B팀 로고 설정
-            tk.Label(team_b_frame, text="팀 로고:", fg='white', bg='#2a2a2a').pack(pady=(10, 5))
-            team_b_logo_var = tk.StringVar(value=getattr(self, 'team2_logo', None) or "")
-            
-            logo_display_frame = tk.Frame(team_b_frame, bg='#2a2a2a')
-            logo_display_frame.pack(pady=5)
-            
-            team_b_logo_label = tk.Label(logo_display_frame, 
-                                         text="로고 없음" if not team_b_logo_var.get() else "로고 설정됨",
-                                         fg='yellow', bg='#2a2a2a')
-            team_b_logo_label.pack(side=tk.LEFT, padx=5)
-            
-            def select_team_b_logo():
-                result = show_logo_selection_dialog(settings_window)
-                
-                # None이면 취소 (아무 것도 하지 않음)
-                if result is None:
-                    return
-                
-                # 선택됨 (빈 문자열 = 로고 없음, URL = 로고 있음)
-                team_b_logo_var.set(result)
-                
-                # UI 업데이트만 (실제 저장은 save_settings에서)
-                team_b_logo_label.config(text="로고 없음" if not result else "로고 설정됨")
-                print(f"B팀 로고 선택: {result if result else '(로고 없음)'}")
-            
-            tk.Button(logo_display_frame, text="로고 선택", command=select_team_b_logo,
-                     font=('Arial', 9), bg='#2196F3', fg='black').pack(side=tk.LEFT, padx=5)
-        else:
-            # 서버 게임: 읽기 전용으로 컬러 표시
-            tk.Label(team_b_frame, text="팀 컬러:", fg='white', bg='#2a2a2a').pack(pady=(10, 5))
-            team_b_color = getattr(self, 'team2_color', None) or self.cfg.get("team_b_color", "#2563EB")
-            # 팔레트에 있으면 이름, 없으면 hex 코드 표시
-            color_display = color_map.get(team_b_color, team_b_color)
-            tk.Label(team_b_frame, text=color_display, fg='lightcoral', bg='#2a2a2a',
-                    font=self.font_small).pack(pady=5)
+        # A팀 설정 (왼쪽), B팀 설정 (오른쪽)
+        team_a_entry, team_a_color_var, team_a_logo_var = self._build_team_settings(
+            teams_frame, settings_window, 'A', tk.LEFT, (0, 10), 'lightblue')
+        team_b_entry, team_b_color_var, team_b_logo_var = self._build_team_settings(
+            teams_frame, settings_window, 'B', tk.RIGHT, (10, 0), 'lightcoral')
         
         # 구분선
-        tk.Label(scrollable_frame, text="─────────────────────────────────────", fg='gray', bg='#2a2a2a').pack(pady=10)
+        tk.Label(scrollable_frame, text="─────────────────────────────────────", fg='gray').pack(pady=10)
         
         # ===== 모니터 설정 =====
         monitor_frame = tk.LabelFrame(scrollable_frame, text="모니터 및 팀 순서 설정", 
-                                     font=self.font_small, fg='white', bg='#2a2a2a')
+                                     font=self.font_small)
         monitor_frame.pack(fill=tk.X, padx=20, pady=10)
         
         # 듀얼모니터 설정
-        dual_frame = tk.Frame(monitor_frame, bg='#2a2a2a')
+        dual_frame = tk.Frame(monitor_frame)
         dual_frame.pack(pady=5, padx=10, anchor=tk.W)
         
         dual_monitor_var = tk.BooleanVar(value=self.cfg.get("dual_monitor", False))
         tk.Checkbutton(dual_frame, text="듀얼모니터 사용 (프레젠테이션 창 표시)", 
-                      variable=dual_monitor_var, 
-                      fg='white', bg='#2a2a2a', selectcolor='#444444').pack(side=tk.LEFT)
+                      variable=dual_monitor_var).pack(side=tk.LEFT)
         
         # 팀 순서 바꾸기 (독립적으로 제어)
-        tk.Label(monitor_frame, text="팀 순서 전환:", fg='lightgreen', bg='#2a2a2a',
+        tk.Label(monitor_frame, text="팀 순서 전환:", fg='lightgreen',
                 font=self.font_small).pack(pady=(15, 5), padx=10, anchor=tk.W)
         
         # 컨트롤 창 팀 순서
-        control_swap_frame = tk.Frame(monitor_frame, bg='#2a2a2a')
+        control_swap_frame = tk.Frame(monitor_frame)
         control_swap_frame.pack(pady=5, padx=20, anchor=tk.W)
         
         control_team_swapped_var = tk.BooleanVar(value=self.cfg.get("control_team_swapped", False))
         tk.Checkbutton(control_swap_frame, text="컨트롤 창:", 
-                      variable=control_team_swapped_var, 
-                      fg='white', bg='#2a2a2a', selectcolor='#444444').pack(side=tk.LEFT)
+                      variable=control_team_swapped_var).pack(side=tk.LEFT)
         
         # 현재 팀 순서 표시
         control_order_text = "팀 B | 팀 A" if control_team_swapped_var.get() else "팀 A | 팀 B"
         control_order_label = tk.Label(control_swap_frame, text=control_order_text, 
-                                      fg='lightblue', bg='#2a2a2a', font=self.font_small)
+                                      fg='lightblue', font=self.font_small)
         control_order_label.pack(side=tk.LEFT, padx=10)
         
         # 체크박스 변경 시 라벨 업데이트
-        def update_control_order():
+        def update_control_order(*args):
             new_text = "팀 B | 팀 A" if control_team_swapped_var.get() else "팀 A | 팀 B"
             control_order_label.config(text=new_text)
         
-        control_team_swapped_var.trace_add('write', lambda *args: update_control_order())
+        control_team_swapped_var.trace_add('write', update_control_order)
         
         # 전체화면 팀 순서
-        presentation_swap_frame = tk.Frame(monitor_frame, bg='#2a2a2a')
+        presentation_swap_frame = tk.Frame(monitor_frame)
         presentation_swap_frame.pack(pady=5, padx=20, anchor=tk.W)
         
         presentation_team_swapped_var = tk.BooleanVar(value=self.cfg.get("presentation_team_swapped", False))
         tk.Checkbutton(presentation_swap_frame, text="전체화면:", 
-                      variable=presentation_team_swapped_var, 
-                      fg='white', bg='#2a2a2a', selectcolor='#444444').pack(side=tk.LEFT)
+                      variable=presentation_team_swapped_var).pack(side=tk.LEFT)
         
         # 현재 팀 순서 표시
         pres_order_text = "팀 B | 팀 A" if presentation_team_swapped_var.get() else "팀 A | 팀 B"
         pres_order_label = tk.Label(presentation_swap_frame, text=pres_order_text, 
-                                   fg='lightcoral', bg='#2a2a2a', font=self.font_small)
+                                   fg='lightcoral', font=self.font_small)
         pres_order_label.pack(side=tk.LEFT, padx=10)
         
         # 체크박스 변경 시 라벨 업데이트
-        def update_pres_order():
+        def update_pres_order(*args):
             new_text = "팀 B | 팀 A" if presentation_team_swapped_var.get() else "팀 A | 팀 B"
             pres_order_label.config(text=new_text)
         
-        presentation_team_swapped_var.trace_add('write', lambda *args: update_pres_order())
+        presentation_team_swapped_var.trace_add('write', update_pres_order)
         
         # 구분선
-        tk.Label(scrollable_frame, text="─────────────────────────────────────", fg='gray', bg='#2a2a2a').pack(pady=10)
+        tk.Label(scrollable_frame, text="─────────────────────────────────────", fg='gray').pack(pady=10)
         
         # ===== 게임 규칙 설정 =====
         rules_frame = tk.LabelFrame(scrollable_frame, text="게임 규칙", 
-                                    font=self.font_small, fg='yellow', bg='#2a2a2a')
+                                    font=self.font_small, fg='yellow')
         rules_frame.pack(fill=tk.X, padx=20, pady=10)
         
         # 게임 시간 설정
-        tk.Label(rules_frame, text="게임 시간 (분):", fg='white', bg='#2a2a2a').pack(pady=(10, 5))
-        game_minutes_frame = tk.Frame(rules_frame, bg='#2a2a2a')
-        game_minutes_frame.pack()
-        
+        tk.Label(rules_frame, text="게임 시간 (분):").pack(pady=(10, 5))
         game_minutes_var = tk.IntVar(value=self.cfg.get("game_minutes", 9))
-        for minutes in range(5, 13):
-            tk.Radiobutton(game_minutes_frame, text=f"{minutes}분", variable=game_minutes_var, 
-                          value=minutes, fg='white', bg='#2a2a2a', selectcolor='#444444').pack(side=tk.LEFT, padx=3)
+        self._radio_row(rules_frame, game_minutes_var, range(5, 13), "{}분")
         
         # 타임아웃 갯수 설정
-        tk.Label(rules_frame, text="타임아웃 갯수:", fg='white', bg='#2a2a2a').pack(pady=(10, 5))
-        timeout_count_frame = tk.Frame(rules_frame, bg='#2a2a2a')
-        timeout_count_frame.pack()
-        
+        tk.Label(rules_frame, text="타임아웃 갯수:").pack(pady=(10, 5))
         timeout_count_var = tk.IntVar(value=self.cfg.get("timeout_count", 3))
-        for count in range(1, 6):
-            tk.Radiobutton(timeout_count_frame, text=f"{count}개", variable=timeout_count_var, 
-                          value=count, fg='white', bg='#2a2a2a', selectcolor='#444444').pack(side=tk.LEFT, padx=5)
+        self._radio_row(rules_frame, timeout_count_var, range(1, 6), "{}개", padx=5)
         
         # 연장전 시간 설정
-        tk.Label(rules_frame, text="연장전 시간 (분):", fg='white', bg='#2a2a2a').pack(pady=(10, 5))
-        overtime_frame = tk.Frame(rules_frame, bg='#2a2a2a')
-        overtime_frame.pack(pady=(0, 10))
-        
+        tk.Label(rules_frame, text="연장전 시간 (분):").pack(pady=(10, 5))
         overtime_minutes_var = tk.IntVar(value=self.cfg.get("overtime_minutes", 5))
-        for minutes in range(1, 11):
-            tk.Radiobutton(overtime_frame, text=f"{minutes}분", variable=overtime_minutes_var, 
-                          value=minutes, fg='white', bg='#2a2a2a', selectcolor='#444444').pack(side=tk.LEFT, padx=3)
+        self._radio_row(rules_frame, overtime_minutes_var, range(1, 11), "{}분", pady=(0, 10))
         
         def save_settings():
-            # 게임 ID 저장
+            # 저장 전 로고 (바뀐 항목에만 화면 갱신, 서버 전송, 창 재배치)
+            logos_before = (self.team1_logo, self.team2_logo)
+            
+            # 위젯 값은 한 번씩만 읽기 (Tcl 왕복 최소화)
             new_game_id = game_id_entry.get().strip()
+            team_a_name = team_a_entry.get() if team_a_entry else None
+            team_b_name = team_b_entry.get() if team_b_entry else None
+            
+            game_minutes = game_minutes_var.get()
+            timeout_count = timeout_count_var.get()
+            overtime_minutes = overtime_minutes_var.get()
+            updates = {
+                "dual_monitor": dual_monitor_var.get(),
+                "control_team_swapped": control_team_swapped_var.get(),
+                "presentation_team_swapped": presentation_team_swapped_var.get(),
+                "game_minutes": game_minutes,
+                "timeout_count": timeout_count,
+                "overtime_minutes": overtime_minutes,
+                # 파생 값 (초 단위, 같은 설정 파일을 쓰는 pygame 버전도 이 키를 읽음)
+                "game_seconds": game_minutes * 60,
+                "timeouts_per_team": timeout_count,
+                "overtime_seconds": overtime_minutes * 60,
+            }
+            
+            # 게임 ID 저장
             if new_game_id:
-                self.cfg["game_id"] = new_game_id
+                updates["game_id"] = new_game_id
                 self.game_id = new_game_id
+                self._broadcast_channel = None
             
-            # 팀 이름은 바로 시작일 때만 저장 (서버 게임은 수정 불가)
-            if self.is_quick_start and team_a_entry and team_b_entry:
-                self.cfg["teamA"] = team_a_entry.get()
-                self.cfg["teamB"] = team_b_entry.get()
-                self.teamA_name = team_a_entry.get()
-                self.teamB_name = team_b_entry.get()
-            
-            self.cfg["dual_monitor"] = dual_monitor_var.get()
-            self.cfg["control_team_swapped"] = control_team_swapped_var.get()
-            self.cfg["presentation_team_swapped"] = presentation_team_swapped_var.get()
-            
-            # 새로운 설정들 저장
-            self.cfg["game_minutes"] = game_minutes_var.get()
-            self.cfg["timeout_count"] = timeout_count_var.get()
-            self.cfg["overtime_minutes"] = overtime_minutes_var.get()
-            
-            # 팀 컬러와 로고는 바로 시작일 때만 저장
+            # 팀 이름, 컬러, 로고는 바로 시작일 때만 저장 (서버 게임은 수정 불가)
             if self.is_quick_start:
+                if team_a_entry and team_b_entry:
+                    updates["teamA"] = self.teamA_name = team_a_name
+                    updates["teamB"] = self.teamB_name = team_b_name
+                
                 if team_a_color_var and team_b_color_var:
-                    self.cfg["team_a_color"] = team_a_color_var.get()
-                    self.cfg["team_b_color"] = team_b_color_var.get()
+                    updates["team_a_color"] = team_a_color_var.get()
+                    updates["team_b_color"] = team_b_color_var.get()
                 
-                # 팀 로고 저장
+                # 팀 로고 저장 (URL 앞뒤 공백 제거, 빈 값은 None으로 통일)
                 if team_a_logo_var:
-                    logo_value = team_a_logo_var.get()
-                    self.team1_logo = None if logo_value == "" else logo_value
-                    print(f"저장: A팀 로고 = {self.team1_logo}")
+                    self.team1_logo = team_a_logo_var.get().strip() or None
+                    dlog("저장: A팀 로고 = %s", self.team1_logo)
                 
                 if team_b_logo_var:
-                    logo_value = team_b_logo_var.get()
-                    self.team2_logo = None if logo_value == "" else logo_value
-                    print(f"저장: B팀 로고 = {self.team2_logo}")
-            
-            # 설정에 따른 값 업데이트
-            self.cfg["game_seconds"] = self.cfg["game_minutes"] * 60
-            self.cfg["timeouts_per_team"] = self.cfg["timeout_count"]
-            self.cfg["overtime_seconds"] = self.cfg["overtime_minutes"] * 60
-            
-            # 현재 게임 시간과 타임아웃 수 업데이트
-            self.game_seconds = self.cfg["game_seconds"]
-            self.timeoutsA = self.cfg["timeout_count"]
-            self.timeoutsB = self.cfg["timeout_count"]
-            
-            save_cfg(self.cfg)
+                    self.team2_logo = team_b_logo_var.get().strip() or None
+                    dlog("저장: B팀 로고 = %s", self.team2_logo)
+            
+            # 바뀐 키를 구한 뒤 설정에 한 번에 반영
+            changed = {k for k, v in updates.items() if self.cfg.get(k) != v}
+            self.cfg.update(updates)
+            if (self.team1_logo, self.team2_logo) != logos_before:
+                changed.add("logos")
+            if not changed:
+                # 바뀐 설정 없음: 저장, 화면 갱신, 서버 전송 모두 생략
+                self._close_settings_window()
+                return
+            
+            # 현재 게임 시간과 타임아웃 수 업데이트 (해당 설정이 바뀐 경우에만 - 진행 중인 시간 유지)
+            if "game_seconds" in changed:
+                self.game_seconds = self.cfg["game_seconds"]
+            if "timeouts_per_team" in changed:
+                self.timeoutsA = self.cfg["timeouts_per_team"]
+                self.timeoutsB = self.cfg["timeouts_per_team"]
+            
+            self.request_save_cfg()
             self.update_displays()
             
-            # 설정 저장 시 Supabase 업데이트
-            print(f"설정 저장 완료 - 서버 업데이트 시작")
+            # 설정 저장 시 Supabase 업데이트 (지문이 같으면 전송 생략)
+            dlog("설정 저장 완료 - 서버 업데이트 시작")
             self.update_supabase_data()
-            print(f"설정 저장 후 로고 상태: team1_logo={self.team1_logo}, team2_logo={self.team2_logo}")
+            dlog("설정 저장 후 로고 상태: team1_logo=%s, team2_logo=%s", self.team1_logo, self.team2_logo)
             
-            # 듀얼모니터 설정 변경시 창 재생성
+            # 듀얼모니터 설정 변경시 창 표시/숨김 (이미 만든 창은 팀 순서가 바뀐 경우에만 재배치)
             if self.cfg.get("dual_monitor", False):
-                if hasattr(self, 'presentation_window'):
-                    self.presentation_window.destroy()
-                self.create_presentation_window()
+                if self._pres_built and "presentation_team_swapped" in changed:
+                    self._assign_sides(self.cfg["presentation_team_swapped"])
+                self.show_presentation_window()
             else:
-                if hasattr(self, 'presentation_window'):
-                    self.presentation_window.destroy()
-                    del self.presentation_window
+                self.hide_presentation_window()
             
-            # 컨트롤 창 재생성
-            self.control_window.destroy()
-            self.create_control_window()
-            
-            # 키보드 바인딩 다시 설정
-            self.setup_keyboard_bindings()
+            # 컨트롤 창은 팀 순서가 바뀐 경우에만 재생성 (이름/점수 등은 StringVar로 이미 반영됨)
+            if "control_team_swapped" in changed:
+                self.control_window.destroy()
+                self.create_control_window()
+                
+                # 키보드 바인딩 다시 설정
+                self.setup_keyboard_bindings()
+            elif "game_id" in changed:
+                # 창 제목의 방송 채널만 갱신 (다음 크기 표시 갱신 때도 새 채널 사용)
+                self.control_window.title(f"Novato Scoreboard - {self.get_broadcast_channel()}")
+                self._last_hints_size = None
             
-            settings_window.destroy()
+            self._close_settings_window()
         
         # 저장/취소 버튼 프레임
-        button_frame = tk.Frame(scrollable_frame, bg='#2a2a2a')
+        button_frame = tk.Frame(scrollable_frame)
         button_frame.pack(pady=20)
         
-        tk.Button(button_frame, text="저장", command=save_settings, 
-                 font=self.font_small, fg='green', width=10).pack(side=tk.LEFT, padx=10)
+        tk.Button(button_frame, text="저장", command=save_settings, fg='green', width=10).pack(side=tk.LEFT, padx=10)
         
-        tk.Button(button_frame, text="취소", command=settings_window.destroy, 
-                 font=self.font_small, fg='red', width=10).pack(side=tk.LEFT, padx=10)
+        tk.Button(button_frame, text="취소", command=self._close_settings_window, fg='red', width=10).pack(side=tk.LEFT, padx=10)
         
         # 마우스 휠 스크롤 지원 (macOS 및 Windows/Linux 모두 지원)
         def _on_mousewheel(event):
-            # macOS와 Windows에서 delta 값이 다름
+            # 전역 바인딩이므로 설정 창 밖 위젯의 이벤트는 무시
+            if not str(event.widget).startswith(str(settings_window)):
+                return
+            # Linux는 delta 없이 Button-4(위)/Button-5(아래)
+            # delta는 플랫폼 이름이 아니라 크기로 판단 (Tk 8.7+는 x11/aqua도 120 단위)
             if event.delta:
-                # macOS는 delta가 작은 값, Windows는 120 단위
-                delta = event.delta
-                if abs(delta) >= 120:
-                    # Windows
-                    canvas.yview_scroll(int(-1 * (delta / 120)), "units")
-                else:
-                    # macOS
-                    canvas.yview_scroll(int(-1 * delta), "units")
+                d = event.delta
+                units = int(-d / 120) if abs(d) >= 120 else (-1 if d > 0 else 1)
             else:
-                # Linux (Button-4, Button-5)
-                if event.num == 4:
-                    canvas.yview_scroll(-1, "units")
-                elif event.num == 5:
-                    canvas.yview_scroll(1, "units")
-        
-        def _bind_mousewheel(widget):
-            """위젯과 그 자식들에 마우스 휠 이벤트 바인딩"""
-            widget.bind("<MouseWheel>", _on_mousewheel)  # Windows/macOS
-            widget.bind("<Button-4>", _on_mousewheel)    # Linux 스크롤 업
-            widget.bind("<Button-5>", _on_mousewheel)    # Linux 스크롤 다운
-            
-            # 모든 자식 위젯에도 바인딩
-            for child in widget.winfo_children():
-                _bind_mousewheel(child)
-        
-        # canvas와 scrollable_frame에 마우스 휠 바인딩
-        _bind_mousewheel(canvas)
-        _bind_mousewheel(scrollable_frame)
+                units = self._BUTTON_SCROLL.get(event.num, 0)
+            canvas.yview_scroll(units, "units")
+        
+        def _bind_mousewheel(event):
+            """포인터가 설정 창 안에 있는 동안만 전역 휠 바인딩 (자식 위젯마다 바인딩하지 않음)"""
+            # 모든 자식의 bindtags에 Toplevel이 있으므로 창 자체의 Enter만 처리
+            if event.widget is not settings_window:
+                return
+            for sequence in self._WHEEL_EVENTS:
+                canvas.bind_all(sequence, _on_mousewheel)
+        
+        settings_window.bind("<Enter>", _bind_mousewheel)
+        settings_window.bind("<Leave>", self._unbind_settings_wheel)
+        
+        def refresh_settings_values():
+            """입력 값을 현재 설정/게임 상태로 다시 채움 (저장하지 않고 닫았던 변경은 버림)"""
+            channel_label.config(text=f"방송 채널: {self.get_broadcast_channel()}")
+            game_id_entry.delete(0, tk.END)
+            game_id_entry.insert(0, self.game_id)
+            if self.is_quick_start:
+                for entry, name in ((team_a_entry, self.teamA_name), (team_b_entry, self.teamB_name)):
+                    entry.delete(0, tk.END)
+                    entry.insert(0, name)
+                team_a_color_var.set(self.cfg.get("team_a_color", "#F4F4F4"))
+                team_b_color_var.set(self.cfg.get("team_b_color", "#2563EB"))
+                team_a_logo_var.set(self.team1_logo or "")
+                team_b_logo_var.set(self.team2_logo or "")
+            dual_monitor_var.set(self.cfg.get("dual_monitor", False))
+            control_team_swapped_var.set(self.cfg.get("control_team_swapped", False))
+            presentation_team_swapped_var.set(self.cfg.get("presentation_team_swapped", False))
+            game_minutes_var.set(self.cfg.get("game_minutes", 9))
+            timeout_count_var.set(self.cfg.get("timeout_count", 3))
+            overtime_minutes_var.set(self.cfg.get("overtime_minutes", 5))
+        
+        self._settings_window = settings_window
+        self._settings_refresh = refresh_settings_values
+        refresh_settings_values()
+        self._open_settings_window()
     
     def run(self):
         """메인 루프 실행"""
         try:
             self.root.mainloop()
         except KeyboardInterrupt:
-            self.timer_running = False
+            self.stop_timer()
             self.root.quit()
 
-def main():
+def _positive_int(value):
+    return max(1, int(value))
+
+# 명령행 인수 -> 설정 키 (속성 이름, 설정 키, 변환 함수)
+_CLI_CFG_ARGS = (
+    ("teamA", "teamA", str),
+    ("teamB", "teamB", str),
+    ("game", "game_seconds", _positive_int),
+    ("shot", "shot_seconds", _positive_int),
+    ("periods", "period_max", _positive_int),
+)
+
+def _build_parser():
     parser = argparse.ArgumentParser(description="Tkinter Basketball Scoreboard")
     parser.add_argument("--teamA", type=str, help="A팀 이름")
     parser.add_argument("--teamB", type=str, help="B팀 이름")
@@ -2208,19 +2459,35 @@ def main():
     parser.add_argument("--shot", type=int, help="샷 클럭 시간 (초)")
     parser.add_argument("--periods", type=int, help="최대 쿼터 수")
     parser.add_argument("--small-screen", action="store_true", help="작은 화면 모드 (726x416)")
-    args = parser.parse_args()
+    return parser
+
+# 명령행 인수가 없을 때의 parse_args() 결과 (_build_parser의 기본값과 같게 유지)
+_NO_ARGS = argparse.Namespace(teamA=None, teamB=None, game=None, shot=None, periods=None, small_screen=False)
+
+def main():
+    # 인수 없이 실행하면 (바탕화면 더블클릭 등) 파서를 만들지 않고 기본값 사용
+    # --help나 잘못된 인수로 바로 종료될 때 네트워크 조회를 기다리지 않도록 먼저 처리
+    args = _build_parser().parse_args() if len(sys.argv) > 1 else _NO_ARGS
+    
+    # 게임 목록 조회를 Tk 초기화와 겹쳐서 미리 시작
+    preload_pool = ThreadPoolExecutor(max_workers=1)
+    games_future = preload_pool.submit(load_game_list)
+    preload_pool.shutdown(wait=False)
     
     # 설정 로드 및 명령행 인수 적용
     cfg = load_cfg()
-    if args.teamA: cfg["teamA"] = args.teamA
-    if args.teamB: cfg["teamB"] = args.teamB
-    if args.game: cfg["game_seconds"] = max(1, int(args.game))
-    if args.shot: cfg["shot_seconds"] = max(1, int(args.shot))
-    if args.periods: cfg["period_max"] = max(1, int(args.periods))
-    save_cfg(cfg)
+    overrides = {}
+    for attr, key, coerce in _CLI_CFG_ARGS:
+        value = getattr(args, attr)
+        if value:
+            overrides[key] = coerce(value)
+    # 바뀐 값이 있을 때만 설정 파일 저장
+    if any(cfg.get(k) != v for k, v in overrides.items()):
+        cfg.update(overrides)
+        save_cfg(cfg)
     
     # 게임 선택 다이얼로그 표시 (작은 화면 모드 전달)
-    selected_game = show_game_selection_dialog(small_screen=args.small_screen)
+    selected_game = show_game_selection_dialog(small_screen=args.small_screen, games_future=games_future)
     
     # 스코어보드 실행 (작은 화면 모드 전달)
     app = DualMonitorScoreboard(selected_game, small_screen=args.small_screen)